@@ -0,0 +1,2 @@
+from .ngrams import NgramCollector, NgramIndex
+from .cooccurrence import CharacterGraphCollector
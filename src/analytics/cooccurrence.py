@@ -0,0 +1,125 @@
+import array
+import json
+import threading
+
+import numpy as np
+
+
+class CharacterGraphCollector(object):
+    """
+        aggregate the character graphs of the parsed episodes over the whole corpus.
+        for every pair of characters the number of shared episodes and the number of turns
+        from one character to the other are counted
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: the character graph is written to this path as json
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.characters = dict()
+
+        # one entry per pair and episode, the counting is done vectorized when the graph is built
+        self.cooccurrence_sources = array.array('I')
+        self.cooccurrence_targets = array.array('I')
+        self.transition_sources = array.array('I')
+        self.transition_targets = array.array('I')
+        self.transition_counts = array.array('I')
+        self.episodes = array.array('I')
+
+    def _get_id(self, show: str, character: str):
+        """
+        return the id of the given character, new characters get the next free id
+        :param show: name of the show
+        :param character:
+        :return: id
+        """
+
+        key = (show, character)
+        if key not in self.characters:
+            self.characters[key] = len(self.characters)
+
+        return self.characters[key]
+
+    def add_episode(self, show, episode):
+        """
+        add the character graph of the given episode
+        :param show: the show the episode belongs to
+        :param episode:
+        :return:
+        """
+
+        with self.lock:
+            ids = [self._get_id(show.name, c) for c in episode.episode_characters]
+
+            self.episodes.extend(ids)
+            for i, source in enumerate(ids):
+                for target in ids[i + 1:]:
+                    self.cooccurrence_sources.append(source)
+                    self.cooccurrence_targets.append(target)
+
+            for (source, target), count in episode.character_transitions.items():
+                self.transition_sources.append(self._get_id(show.name, source))
+                self.transition_targets.append(self._get_id(show.name, target))
+                self.transition_counts.append(count)
+
+    def _count_pairs(self, sources: array.array, targets: array.array, counts: array.array=None):
+        """
+        sum up the counts per (source, target) pair
+        :param sources: source character ids
+        :param targets: target character ids
+        :param counts: optional counts per entry, every entry counts once if not given
+        :return: dictionary with (source, target) as key and the sum as value
+        """
+
+        n = max(len(self.characters), 1)
+        keys = np.frombuffer(sources, dtype=np.uint32).astype(np.int64) * n + np.frombuffer(targets, dtype=np.uint32)
+        weights = np.frombuffer(counts, dtype=np.uint32) if counts is not None else None
+
+        # sparse counting, only the pairs which occur are summed up
+        pairs, inverse = np.unique(keys, return_inverse=True)
+        sums = np.bincount(inverse, weights=weights, minlength=len(pairs)).astype(np.int64)
+
+        return {(int(p // n), int(p % n)): int(c) for p, c in zip(pairs, sums)}
+
+    def build(self):
+        """
+        build the character graph per show
+        :return: dictionary with the show name as key and the characters and edges as value
+        """
+
+        with self.lock:
+            names = {i: key for key, i in self.characters.items()}
+            episodes = np.bincount(np.frombuffer(self.episodes, dtype=np.uint32), minlength=len(self.characters))
+            cooccurrences = self._count_pairs(self.cooccurrence_sources, self.cooccurrence_targets)
+            transitions = self._count_pairs(self.transition_sources, self.transition_targets, self.transition_counts)
+
+            graph = dict()
+            for (show, character), i in self.characters.items():
+                graph.setdefault(show, dict(characters=dict(), edges=list()))
+                graph[show]['characters'][character] = dict(episodes=int(episodes[i]))
+
+            # the shared episodes are symmetric, the turns are directed
+            edges = dict()
+            for (source, target), count in cooccurrences.items():
+                edges[(source, target)] = dict(episodes=count, transitions=0)
+                edges[(target, source)] = dict(episodes=count, transitions=0)
+            for (source, target), count in transitions.items():
+                edges.setdefault((source, target), dict(episodes=0, transitions=0))['transitions'] = count
+
+            for (source, target), edge in sorted(edges.items(), key=lambda e: (-e[1]['episodes'], -e[1]['transitions'])):
+                show, source_name = names[source]
+                graph[show]['edges'].append(dict(source=source_name, target=names[target][1], **edge))
+
+            return graph
+
+    def write(self):
+        """
+        build the character graph and write it to the configured path
+        :return:
+        """
+
+        with open(self.path, 'w') as f:
+            json.dump(self.build(), f, indent=2)
@@ -0,0 +1,254 @@
+import array
+import threading
+
+import numpy as np
+
+from transcript import tokenize
+
+
+def encode_strings(strings: list):
+    """
+    encode the given strings as a single utf-8 blob with the offsets of every string,
+    compared to a fixed width unicode array every string only takes its own length
+    :param strings:
+    :return: tuple of blob (uint8 array) and offsets (one more entry than strings)
+    """
+
+    encoded = [s.encode() for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+class NgramIndex(object):
+    """
+        n-gram frequencies per group (character, episode, season), sorted by frequency within each group
+    """
+
+    def __init__(self, vocabulary_blob: np.ndarray, vocabulary_offsets: np.ndarray, ngram_sizes: np.ndarray,
+                 group_blob: np.ndarray, group_name_offsets: np.ndarray, group_offsets: np.ndarray, ngram_ids: np.ndarray, counts: np.ndarray):
+        """
+        :param vocabulary_blob: all n-grams utf-8 encoded, the position of an n-gram in the offsets is its id
+        :param vocabulary_offsets: start of every n-gram in the vocabulary blob, one more entry than n-grams
+        :param ngram_sizes: number of tokens per n-gram id
+        :param group_blob: all group names ("show:kind:value") utf-8 encoded, the position in the offsets is the group id
+        :param group_name_offsets: start of every group name in the group blob, one more entry than groups
+        :param group_offsets: start of every group in ngram_ids and counts, one more entry than groups
+        :param ngram_ids: n-gram ids, grouped by group and sorted by count descending within the group
+        :param counts: number of occurrences for the n-gram ids
+        """
+
+        self.vocabulary_blob = vocabulary_blob
+        self.vocabulary_offsets = vocabulary_offsets
+        self.ngram_sizes = ngram_sizes
+        self.group_blob = group_blob
+        self.group_name_offsets = group_name_offsets
+        self.group_offsets = group_offsets
+        self.ngram_ids = ngram_ids
+        self.counts = counts
+
+        # the group names are few compared to the n-grams, they are decoded once for the lookup
+        groups = group_blob.tobytes()
+        self.group_ids = {groups[group_name_offsets[i]:group_name_offsets[i + 1]].decode(): i for i in range(len(group_name_offsets) - 1)}
+
+    def get_ngram(self, ngram_id: int):
+        """
+        return the n-gram with the given id
+        :param ngram_id:
+        :return: n-gram
+        """
+
+        return self.vocabulary_blob[self.vocabulary_offsets[ngram_id]:self.vocabulary_offsets[ngram_id + 1]].tobytes().decode()
+
+    @staticmethod
+    def get_group_name(show: str, kind: str, value):
+        """
+        return the name of a group
+        :param show: name of the show
+        :param kind: character, episode or season
+        :param value: the character name, episode number or season number
+        :return: group name
+        """
+
+        return f'{show}:{kind}:{value}'
+
+    def top(self, show: str, kind: str, value, limit: int=10, n: int=None):
+        """
+        return the most frequent n-grams of the given group
+        :param show: name of the show
+        :param kind: character, episode or season
+        :param value: the character name, episode number or season number
+        :param limit: maximum number of n-grams to return
+        :param n: only return n-grams of the given size
+        :return: list of (n-gram, count) tuples
+        """
+
+        group_id = self.group_ids.get(self.get_group_name(show, kind, value))
+        if group_id is None:
+            return list()
+
+        ngram_ids = self.ngram_ids[self.group_offsets[group_id]:self.group_offsets[group_id + 1]]
+        counts = self.counts[self.group_offsets[group_id]:self.group_offsets[group_id + 1]]
+
+        if n:
+            mask = self.ngram_sizes[ngram_ids] == n
+            ngram_ids, counts = ngram_ids[mask], counts[mask]
+
+        return [(self.get_ngram(i), int(c)) for i, c in zip(ngram_ids[:limit], counts[:limit])]
+
+    def save(self, path: str):
+        """
+        write the index to the given path as compressed numpy archive
+        :param path:
+        :return:
+        """
+
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                vocabulary_blob=self.vocabulary_blob,
+                vocabulary_offsets=self.vocabulary_offsets,
+                ngram_sizes=self.ngram_sizes,
+                group_blob=self.group_blob,
+                group_name_offsets=self.group_name_offsets,
+                group_offsets=self.group_offsets,
+                ngram_ids=self.ngram_ids,
+                counts=self.counts
+            )
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        load the index from the given path
+        :param path:
+        :return: n-gram index
+        """
+
+        with np.load(path) as data:
+            return cls(
+                vocabulary_blob=data['vocabulary_blob'],
+                vocabulary_offsets=data['vocabulary_offsets'],
+                ngram_sizes=data['ngram_sizes'],
+                group_blob=data['group_blob'],
+                group_name_offsets=data['group_name_offsets'],
+                group_offsets=data['group_offsets'],
+                ngram_ids=data['ngram_ids'],
+                counts=data['counts']
+            )
+
+
+class NgramCollector(object):
+    """
+        tokenize the spoken lines of the parsed episodes once and collect their n-grams
+        per character, episode and season
+    """
+
+    def __init__(self, path: str, max_n: int=3):
+        """
+        :param path: the n-gram index is written to this path
+        :param max_n: collect n-grams from 1 up to max_n tokens
+        """
+
+        self.path = path
+        self.max_n = max_n
+        self.lock = threading.Lock()
+        self.vocabulary = dict()
+        self.groups = dict()
+        # one entry per n-gram occurrence, the counting is done vectorized when the index is built
+        self.occurrence_groups = array.array('I')
+        self.occurrence_ngrams = array.array('I')
+
+    def _get_ngrams(self, line: str):
+        """
+        return all n-grams of the given line
+        :param line:
+        :return: list of n-grams
+        """
+
+        # same tokens as the line word count, the n-grams are case insensitive
+        tokens = [t.lower() for t in tokenize(line)]
+
+        ngrams = list()
+        for n in range(1, self.max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                ngrams.append(' '.join(tokens[i:i + n]))
+
+        return ngrams
+
+    def _get_id(self, ids: dict, key: str):
+        """
+        return the id for the given key, new keys get the next free id
+        :param ids: dictionary with the known keys
+        :param key:
+        :return: id
+        """
+
+        if key not in ids:
+            ids[key] = len(ids)
+
+        return ids[key]
+
+    def add_episode(self, show, episode):
+        """
+        collect the n-grams of all spoken lines of the given episode
+        :param show: the show the episode belongs to
+        :param episode:
+        :return:
+        """
+
+        lines = [(l.characters or list(), self._get_ngrams(l.line)) for l in episode.lines if l.type == 'speaking']
+
+        with self.lock:
+            episode_groups = [
+                self._get_id(self.groups, NgramIndex.get_group_name(show.name, 'episode', int(episode.episode_number))),
+                self._get_id(self.groups, NgramIndex.get_group_name(show.name, 'season', episode.season)),
+            ]
+
+            for characters, ngrams in lines:
+                ngram_ids = array.array('I', [self._get_id(self.vocabulary, n) for n in ngrams])
+                group_ids = episode_groups + [self._get_id(self.groups, NgramIndex.get_group_name(show.name, 'character', c)) for c in characters]
+
+                for group_id in group_ids:
+                    self.occurrence_groups.extend(array.array('I', [group_id]) * len(ngram_ids))
+                    self.occurrence_ngrams.extend(ngram_ids)
+
+    def build(self):
+        """
+        count the collected n-grams per group
+        :return: n-gram index
+        """
+
+        with self.lock:
+            groups = np.frombuffer(self.occurrence_groups, dtype=np.uint32).astype(np.int64)
+            ngrams = np.frombuffer(self.occurrence_ngrams, dtype=np.uint32).astype(np.int64)
+
+            # count every (group, n-gram) pair at once by combining both ids into a single key
+            keys, counts = np.unique(groups * max(len(self.vocabulary), 1) + ngrams, return_counts=True)
+            key_groups = keys // max(len(self.vocabulary), 1)
+            key_ngrams = keys % max(len(self.vocabulary), 1)
+
+            # sort by group and by count descending within the group
+            order = np.lexsort((key_ngrams, -counts, key_groups))
+
+            vocabulary_blob, vocabulary_offsets = encode_strings(list(self.vocabulary.keys()))
+            group_blob, group_name_offsets = encode_strings(list(self.groups.keys()))
+
+            return NgramIndex(
+                vocabulary_blob=vocabulary_blob,
+                vocabulary_offsets=vocabulary_offsets,
+                ngram_sizes=np.array([n.count(' ') + 1 for n in self.vocabulary.keys()], dtype=np.uint8),
+                group_blob=group_blob,
+                group_name_offsets=group_name_offsets,
+                group_offsets=np.searchsorted(key_groups[order], np.arange(len(self.groups) + 1)).astype(np.int64),
+                ngram_ids=key_ngrams[order].astype(np.uint32),
+                counts=counts[order].astype(np.uint32)
+            )
+
+    def write(self):
+        """
+        build the n-gram index and write it to the configured path
+        :return:
+        """
+
+        self.build().save(self.path)
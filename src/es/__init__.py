@@ -1,2 +1,5 @@
-from .elasticsearch import ElasticManagement
-from .kibana import KibanaManagement
\ No newline at end of file
+from .elasticsearch import ElasticManagement, get_bulk_lines
+from .kibana import KibanaManagement
+from .transport import TransportSettings
+from .checkpoint import ImportCheckpoint
+from .batching import BulkBatchController
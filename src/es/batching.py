@@ -0,0 +1,99 @@
+import threading
+
+
+class BulkBatchController(object):
+    """
+        size the bulk requests by the observed response time of the cluster.
+        the payload grows while the requests are answered faster than the target latency
+        and shrinks if they are slower, rejected (429), too large (413) or timed out
+    """
+
+    def __init__(self, target_latency: float=1.0, initial_bytes: int=1024 * 1024, min_bytes: int=64 * 1024, max_bytes: int=16 * 1024 * 1024,
+                 max_documents: int=10000, growth: float=1.25, shrink: float=0.5):
+        """
+        :param target_latency: target response time for a bulk request in seconds
+        :param initial_bytes: payload size of the first bulk request
+        :param min_bytes: smallest payload size, a batch contains at least one document
+        :param max_bytes: largest payload size, initial_bytes and min_bytes are limited to it
+        :param max_documents: maximum number of documents per bulk request
+        :param growth: factor the payload grows by after a fast request
+        :param shrink: factor the payload shrinks by after a slow, rejected, too large or timed out request
+        """
+
+        if max_bytes < 1:
+            raise ValueError(f'The maximum bulk payload size has to be positive, got {max_bytes}')
+
+        self.target_latency = target_latency
+        self.min_bytes = min(min_bytes, max_bytes)
+        self.max_bytes = max_bytes
+        self.max_documents = max_documents
+        self.growth = growth
+        self.shrink = shrink
+
+        self.lock = threading.Lock()
+        self.batch_bytes = min(max(initial_bytes, self.min_bytes), self.max_bytes)
+        self.batches = 0
+        self.rejections = 0
+        self.too_large = 0
+        self.timeouts = 0
+        self.latency = None
+
+    def get_batch(self, sizes: list, start: int):
+        """
+        return the end position of the next batch starting at the given position
+        :param sizes: serialized size in bytes of every document
+        :param start: position of the first document of the batch
+        :return: position after the last document of the batch
+        """
+
+        batch_bytes = self.batch_bytes
+
+        end = start
+        size = 0
+        while end < len(sizes) and end - start < self.max_documents:
+            # only a single document larger than the payload size can exceed it
+            if end > start and size + sizes[end] > batch_bytes:
+                break
+            size += sizes[end]
+            end += 1
+
+        return end
+
+    def record(self, latency: float, rejected: bool=False, too_large: bool=False, timed_out: bool=False):
+        """
+        adjust the payload size to the result of a bulk request
+        :param latency: response time of the request in seconds
+        :param rejected: the cluster rejected (some of) the documents because its queues are full
+        :param too_large: the cluster rejected the request because the payload was too large
+        :param timed_out: the request wasn't answered within the request timeout
+        :return:
+        """
+
+        with self.lock:
+            self.batches += 1
+            self.rejections += int(rejected)
+            self.too_large += int(too_large)
+            self.timeouts += int(timed_out)
+            # smoothed latency, single slow requests shouldn't dominate the state
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+            if rejected or too_large or timed_out or latency > self.target_latency:
+                self.batch_bytes = max(self.min_bytes, int(self.batch_bytes * self.shrink))
+            elif latency < self.target_latency:
+                self.batch_bytes = min(self.max_bytes, int(self.batch_bytes * self.growth))
+
+    def get_state(self):
+        """
+        return the current state of the controller
+        :return: dictionary with the current payload size and the request statistics
+        """
+
+        return dict(
+            batch_bytes=self.batch_bytes,
+            batches=self.batches,
+            rejections=self.rejections,
+            too_large=self.too_large,
+            timeouts=self.timeouts,
+            latency=round(self.latency, 3) if self.latency is not None else None,
+            target_latency=self.target_latency,
+        )
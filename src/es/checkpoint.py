@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import threading
+
+
+class ImportCheckpoint(object):
+    """
+        journal of the documents acknowledged by elasticsearch, allows to resume an interrupted import
+    """
+
+    def __init__(self, path: str):
+        """
+        load the journal from the given path. the journal is created if it doesn't exist yet
+
+        :param path: path to the journal file
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.files = dict()
+
+        self._load()
+
+    def _load(self):
+        """
+        replay the journal. every line is a json object, later lines overwrite earlier ones
+        :return:
+        """
+
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line may be incomplete if the importer died while writing it
+                    logging.warning(f'Ignoring incomplete checkpoint entry "{line.strip()}"')
+                    continue
+
+                self.files[entry['file']] = entry
+
+        logging.info(f'Loaded checkpoint {self.path} with {len(self.files)} files')
+
+    def _get_fingerprint(self, path: str):
+        """
+        return a fingerprint for the given file. if a transcript is replaced by a new version
+        the fingerprint changes and the file is imported again
+
+        :param path: path to the file
+        :return: fingerprint
+        """
+
+        stat = os.stat(path)
+
+        return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+    def _get_entry(self, path: str):
+        """
+        return the journal entry for the given file if it matches the current fingerprint
+        :param path: path to the file
+        :return: entry or None
+        """
+
+        entry = self.files.get(os.path.abspath(path))
+        if entry and entry['fingerprint'] == self._get_fingerprint(path):
+            return entry
+
+        return None
+
+    def _write(self, entry: dict):
+        """
+        append the entry to the journal and make sure it hits the disk
+        :param entry:
+        :return:
+        """
+
+        with self.lock:
+            self.files[entry['file']] = entry
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def is_completed(self, path: str):
+        """
+        return true if all documents of the given file were acknowledged
+        :param path: path to the file
+        :return: true or false
+        """
+
+        entry = self._get_entry(path)
+
+        return bool(entry and entry['completed'])
+
+    def get_acknowledged(self, path: str):
+        """
+        return the number of documents of the given file which were acknowledged
+        :param path: path to the file
+        :return: number of documents
+        """
+
+        entry = self._get_entry(path)
+
+        return entry['acknowledged'] if entry else 0
+
+    def get_generation(self, path: str):
+        """
+        return the generation the documents of the given file were written with.
+        a resumed import needs to continue with the same generation, else the documents written
+        before the interruption would be considered stale
+
+        :param path: path to the file
+        :return: generation or None
+        """
+
+        entry = self._get_entry(path)
+
+        return entry.get('generation') if entry else None
+
+    def acknowledge(self, path: str, acknowledged: int, generation: int=None):
+        """
+        record the number of acknowledged documents for the given file
+        :param path: path to the file
+        :param acknowledged: number of documents acknowledged so far
+        :param generation: optional generation the documents were written with
+        :return:
+        """
+
+        self._write(dict(
+            file=os.path.abspath(path),
+            fingerprint=self._get_fingerprint(path),
+            acknowledged=acknowledged,
+            generation=generation,
+            completed=False
+        ))
+
+    def complete(self, path: str):
+        """
+        mark the given file as completely imported
+        :param path: path to the file
+        :return:
+        """
+
+        self._write(dict(
+            file=os.path.abspath(path),
+            fingerprint=self._get_fingerprint(path),
+            acknowledged=self.get_acknowledged(path),
+            generation=self.get_generation(path),
+            completed=True
+        ))
+
+    def reset(self):
+        """
+        forget all imported files, e.g. after the index was recreated
+        :return:
+        """
+
+        with self.lock:
+            self.files = dict()
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -1,25 +1,56 @@
 import time
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, ApiError, ConnectionTimeout
 import logging
 import json
 
+from .transport import TransportSettings
+from .batching import BulkBatchController
+
+
+def get_bulk_lines(index_name: str, document: dict, routing_field: str=None):
+    """
+    serialize a document for the bulk api
+    :param index_name: name of the index
+    :param document: dictionary with the keys document_id and document
+    :param routing_field: optional document field used as routing value
+    :return: tuple of the encoded action line and document line, without the newlines
+    """
+
+    action = dict(_index=index_name, _id=document.get('document_id'))
+    if routing_field:
+        action['routing'] = str(document.get('document')[routing_field])
+
+    return json.dumps(dict(index=action)).encode(), json.dumps(document.get('document')).encode()
+
+
 class ElasticManagement(object):
     """
         setup elasticsearch connections, create indices and feed data
     """
 
-    def __init__(self, host: str='http://localhost:9200'):
+    # how often a rejected or too large bulk request is sent again
+    max_bulk_attempts = 5
+
+    def __init__(self, host: str='http://localhost:9200', transport: TransportSettings=None, batch_controller: BulkBatchController=None):
         """
         setup connection to elasticsearch
 
-        :param host: http(s) url for elasticsearch host
+        :param host: http(s) url for elasticsearch host, multiple hosts can be given comma separated
+        :param transport: optional transport settings (compression, connection pool size, timeouts, sniffing)
+        :param batch_controller: optional controller sizing the bulk requests, shared by all workers
         """
 
         self.host = host
+        self.transport = transport if transport else TransportSettings()
+        self.batch_controller = batch_controller if batch_controller else BulkBatchController()
         self.client = Elasticsearch(
-            hosts=[self.host]
+            hosts=[h.strip() for h in self.host.split(',')],
+            **self.transport.get_elasticsearch_options()
         )
+        # the bulk requests are retried by feed_index_bulk, which shrinks the batch and backs off in between.
+        # retries inside the client would hide rejections and timeouts from the batch controller
+        self.bulk_client = self.client.options(retry_on_status=(), retry_on_timeout=False)
 
         fail_counter = 0
         while not self.client.ping():
@@ -29,6 +60,10 @@ class ElasticManagement(object):
             fail_counter += 1
             time.sleep(5)
 
+        if self.transport.sniff:
+            # discover the cluster nodes once the cluster is up
+            self.client.transport.sniff(is_initial_sniff=True)
+
 
     def create_index(self, index_name: str, mappings: dict, settings: dict):
         """
@@ -71,4 +106,124 @@ class ElasticManagement(object):
         """
 
         logging.debug(f'Feed index {index_name} with data {json.dumps(data, indent=2)}')
-        self.client.index(index=index_name, body=json.dumps(data), id=id)
\ No newline at end of file
+        self.client.index(index=index_name, body=json.dumps(data), id=id)
+
+    def feed_index_bulk(self, index_name: str, documents: list, batch_size: int=None, start: int=0, on_acknowledged=None, routing_field: str=None):
+        """
+        feed the given index with the given documents using the bulk api
+
+        :param index_name: name of the index
+        :param documents: list of dictionaries with the keys document_id and document
+        :param batch_size: optional fixed number of documents sent per bulk request, by default the batch controller
+                           sizes the requests by the observed response time
+        :param start: skip the documents before this position, e.g. when resuming an import
+        :param on_acknowledged: optional callback, called with the number of acknowledged documents after every batch
+        :param routing_field: optional document field used as routing value
+        :return: number of bytes sent for the acknowledged documents
+        """
+
+        # every document is serialized once, the encoded lines are used to size the batches,
+        # are sent as they are and give the number of bytes sent
+        lines = [None] * len(documents)
+        sizes = [0] * len(documents)
+        for position in range(start, len(documents)):
+            lines[position] = get_bulk_lines(index_name=index_name, document=documents[position], routing_field=routing_field)
+            # both lines are terminated by a newline
+            sizes[position] = len(lines[position][0]) + len(lines[position][1]) + 2
+
+        i = start
+        attempts = 0
+        sent = 0
+        while i < len(documents):
+            end = min(i + batch_size, len(documents)) if batch_size else self.batch_controller.get_batch(sizes, i)
+            batch = documents[i:end]
+            operations = [line for pair in lines[i:end] for line in pair]
+
+            logging.debug(f'Feed index {index_name} with {len(batch)} documents')
+            started = time.monotonic()
+            timed_out = False
+            try:
+                r = self.bulk_client.bulk(operations=operations)
+                status = 200
+            except ApiError as e:
+                if e.meta.status not in (413, 429):
+                    raise e
+                r = None
+                status = e.meta.status
+            except ConnectionTimeout:
+                # on a slow link a too large payload usually ends in a timeout instead of a 413
+                r = None
+                status = None
+                timed_out = True
+
+            # documents rejected because the write queues of the cluster are full can be sent again
+            rejected = status == 429 or bool(r and r.get('errors') and any(item['index'].get('status') == 429 for item in r['items']))
+            too_large = status == 413
+            self.batch_controller.record(latency=time.monotonic() - started, rejected=rejected, too_large=too_large, timed_out=timed_out)
+
+            if rejected or too_large or timed_out:
+                reason = 'rejected' if rejected else 'too large' if too_large else 'timed out'
+                attempts += 1
+                if attempts > self.max_bulk_attempts or (too_large and len(batch) == 1):
+                    raise RuntimeError(f'Unable to index {len(batch)} documents into {index_name}, the request was {reason} {attempts} times')
+                logging.warning(f'Bulk request with {len(batch)} documents for index {index_name} was {reason}, retrying with a smaller batch')
+                time.sleep(attempts if rejected else 0)
+                continue
+
+            if r.get('errors'):
+                failed = [item['index'] for item in r['items'] if 'error' in item['index']]
+                raise RuntimeError(f'Unable to index {len(failed)} documents into {index_name}: {failed[0]["error"]}')
+
+            attempts = 0
+            sent += sum(sizes[i:end])
+            i = end
+
+            if on_acknowledged:
+                on_acknowledged(i)
+
+        return sent
+
+    def replace_episode(self, index_name: str, documents: list, episode_field: str, episode: str, generation: int,
+                        start: int=0, on_acknowledged=None, routing_field: str=None):
+        """
+        replace all documents of an episode. the documents are written with the bulk api, tagged with the
+        given generation. afterwards all documents of the episode from older generations
+        (e.g. lines which don't exist anymore after a transcript was corrected) are removed with a single delete by query
+
+        :param index_name: name of the index
+        :param documents: list of dictionaries with the keys document_id and document
+        :param episode_field: document field identifying the episode
+        :param episode: the episode value
+        :param generation: the generation of the documents, usually the start time of the import
+        :param start: skip the documents before this position, e.g. when resuming an import
+        :param on_acknowledged: optional callback, called with the number of acknowledged documents after every batch
+        :param routing_field: optional document field used as routing value
+        :return: tuple of the number of deleted stale documents and the number of bytes sent
+        """
+
+        documents = [dict(d, document=dict(d.get('document'), generation=generation)) for d in documents]
+        sent = self.feed_index_bulk(
+            index_name=index_name,
+            documents=documents,
+            start=start,
+            on_acknowledged=on_acknowledged,
+            routing_field=routing_field
+        )
+
+        # if the documents are routed by the episode all documents of the episode are on the same shard
+        routing = str(episode) if routing_field == episode_field else None
+
+        logging.debug(f'Delete documents of episode {episode} older than generation {generation} from index {index_name}')
+        r = self.client.delete_by_query(
+            index=index_name,
+            routing=routing,
+            conflicts='proceed',
+            query=dict(
+                bool=dict(
+                    filter=[dict(term={episode_field: episode})],
+                    must_not=[dict(term=dict(generation=generation))]
+                )
+            )
+        )
+
+        return r.get('deleted', 0), sent
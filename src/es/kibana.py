@@ -1,16 +1,36 @@
+import hashlib
+import json
 import logging
-import tempfile
 
 import requests
 import time
 
+from .transport import TransportSettings
+
 class KibanaManagement(object):
 
-    def __init__(self, host: str='http://localhost:5601'):
+    # kibana versions by host, the version doesn't change during a run
+    # so we only need to ask kibana once, even when provisioning multiple spaces
+    _versions = dict()
+
+    def __init__(self, host: str='http://localhost:5601', space: str=None, session: requests.Session=None, transport: TransportSettings=None):
+        """
+        setup connection to kibana
+
+        :param host: http(s) url for kibana host
+        :param space: optional kibana space to provision, the default space if not set
+        :param session: optional requests session to share pooled connections between multiple instances
+        :param transport: optional transport settings (connection pool size, timeouts, retries)
+        """
+
         self.host = host
+        self.space = space
         self.headers = {
             'kbn-xsrf': 'reporting'
         }
+        self.transport = transport if transport else TransportSettings()
+        self.timeout = self.transport.timeout
+        self.session = session if session else self.transport.get_requests_session()
 
         fail_counter = 0
         while not self._ping():
@@ -20,6 +40,21 @@ class KibanaManagement(object):
             fail_counter += 1
             time.sleep(5)
 
+        if self.space:
+            self._check_space()
+
+    def _url(self, path: str):
+        """
+        return the url for the given api path, prefixed with the space if one is set
+        :param path: api path
+        :return: url
+        """
+
+        if self.space:
+            return f'{self.host}/s/{self.space}{path}'
+
+        return f'{self.host}{path}'
+
     def _ping(self):
         """
         simple "ping" for kibana to make waiting for working kibana easy
@@ -27,23 +62,37 @@ class KibanaManagement(object):
         """
 
         try:
-            r = requests.get(f'{self.host}/api/data_views/default')
+            # the space is checked separately, a missing space is not a connection problem
+            r = self.session.get(f'{self.host}/api/data_views/default', timeout=self.timeout)
             r.raise_for_status()
         except BaseException:
             return False
 
         return True
 
+    def _check_space(self):
+        """
+        make sure the configured space exists
+        :return:
+        """
+
+        r = self.session.get(f'{self.host}/api/spaces/space/{self.space}', headers=self.headers, timeout=self.timeout)
+        if r.status_code == 404:
+            raise ValueError(f'Kibana space {self.space} does not exist on {self.host}')
+        r.raise_for_status()
+
     def _get_version(self):
         """
         return the kibana version
         :return:
         """
 
-        r = requests.get(f'{self.host}/api/status')
-        r.raise_for_status()
+        if self.host not in self._versions:
+            r = self.session.get(f'{self.host}/api/status', timeout=self.timeout)
+            r.raise_for_status()
+            self._versions[self.host] = r.json()['version']['number']
 
-        return r.json()['version']['number']
+        return self._versions[self.host]
 
     def set_default_route(self, path: str):
         """
@@ -52,9 +101,10 @@ class KibanaManagement(object):
         :return:
         """
 
-        r = requests.put(
-            url=f'{self.host}/api/saved_objects/config/{self._get_version()}',
+        r = self.session.put(
+            url=self._url(f'/api/saved_objects/config/{self._get_version()}'),
             headers=self.headers,
+            timeout=self.timeout,
             json=dict(
                 attributes=dict(
                     defaultRoute=path
@@ -71,9 +121,10 @@ class KibanaManagement(object):
         """
 
         try:
-            r = requests.post(
-                url=f'{self.host}/api/index_patterns/index_pattern',
+            r = self.session.post(
+                url=self._url('/api/index_patterns/index_pattern'),
                 headers=self.headers,
+                timeout=self.timeout,
                 json=dict(
                     override=False,
                     refresh_fields=True,
@@ -86,7 +137,8 @@ class KibanaManagement(object):
             r.raise_for_status()
 
         except requests.exceptions.RequestException as e:
-            if 'Duplicate index pattern' not in r.text:
+            # the request itself can fail (e.g. retries exhausted), then there is no response
+            if e.response is None or 'Duplicate index pattern' not in e.response.text:
                 raise e
 
     def delete_index_pattern(self, title: str):
@@ -97,40 +149,133 @@ class KibanaManagement(object):
         """
 
         try:
-            r = requests.delete(
-                url=f'{self.host}/api/index_patterns/index_pattern/{title}',
+            r = self.session.delete(
+                url=self._url(f'/api/index_patterns/index_pattern/{title}'),
                 headers=self.headers,
+                timeout=self.timeout,
             )
             r.raise_for_status()
 
         except requests.exceptions.RequestException as e:
-            if not e.response.status_code == 404:
+            if e.response is None or not e.response.status_code == 404:
                 raise e
 
+    def _get_saved_objects_from_ndjson(self, ndjson: str):
+        """
+        return the saved objects contained in the given ndjson export.
+        the export summary line (the last line of an export) is not a saved object and is dropped
+
+        :param ndjson:
+        :return: list of saved objects
+        """
+
+        saved_objects = list()
+        for line in ndjson.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            saved_object = json.loads(line)
+            if 'type' not in saved_object or 'id' not in saved_object:
+                continue
+
+            saved_objects.append(saved_object)
+
+        return saved_objects
+
+    def _get_saved_object_hash(self, saved_object: dict):
+        """
+        return a content hash for the given saved object.
+        only the attributes and references are hashed, metadata like updated_at or version
+        changes with every import and would make every object look modified
+
+        :param saved_object:
+        :return: sha256 hex digest
+        """
+
+        content = dict(
+            attributes=saved_object.get('attributes'),
+            references=sorted(saved_object.get('references', list()), key=lambda r: (r.get('type'), r.get('id'), r.get('name'))),
+        )
+
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def _get_installed_saved_object_hashes(self, saved_objects: list):
+        """
+        fetch the given saved objects from kibana with a single bulk request and return their content hashes
+
+        :param saved_objects: list of saved objects
+        :return: dictionary with (type, id) as key and the content hash as value. missing objects are not returned
+        """
+
+        r = self.session.post(
+            url=self._url('/api/saved_objects/_bulk_get'),
+            headers=self.headers,
+            timeout=self.timeout,
+            json=[dict(type=o['type'], id=o['id']) for o in saved_objects],
+        )
+        r.raise_for_status()
+
+        hashes = dict()
+        for installed in r.json().get('saved_objects', list()):
+            # objects which don't exist are returned with an error instead of attributes
+            if 'error' in installed:
+                continue
+            hashes[(installed['type'], installed['id'])] = self._get_saved_object_hash(installed)
+
+        return hashes
+
     def import_dashboard(self, ndjson: str):
         """
-        import the given dashboard ndjson
+        import the given dashboard ndjson.
+        only saved objects which are missing or differ from the installed version are uploaded
 
         :param ndjson:
-        :return:
+        :return: number of imported saved objects
         """
 
-        # temporary store the file on the filesystem so we can pass it as a fileobject
-        # to requests
+        saved_objects = self._get_saved_objects_from_ndjson(ndjson)
+        installed = self._get_installed_saved_object_hashes(saved_objects)
+
+        changed = [o for o in saved_objects if installed.get((o['type'], o['id'])) != self._get_saved_object_hash(o)]
+        if not changed:
+            logging.info(f'All {len(saved_objects)} saved objects are up to date, skip dashboard import')
+            return 0
+
+        logging.info(f'Import {len(changed)} of {len(saved_objects)} saved objects')
+
+        # the upload is done straight from memory, requests accepts the file content as bytes
         try:
-            with tempfile.NamedTemporaryFile(suffix=".ndjson") as fp:
-                fp.write(ndjson.encode())
-                fp.seek(0)
-
-                r = requests.post(
-                    url=f'{self.host}/api/saved_objects/_import',
-                    headers=self.headers,
-                    params=dict(overwrite=True),
-                    files=dict(file=fp),
-                )
-                r.raise_for_status()
+            r = self.session.post(
+                url=self._url('/api/saved_objects/_import'),
+                headers=self.headers,
+                timeout=self.timeout,
+                params=dict(overwrite=True),
+                files=dict(file=('export.ndjson', '\n'.join(json.dumps(o) for o in changed).encode())),
+            )
+            r.raise_for_status()
         except requests.exceptions.RequestException as e:
-            logging.error(r.text)
-            raise e
-        except BaseException as e:
+            # the request itself can fail (e.g. retries exhausted), then there is no response to log
+            if e.response is not None:
+                logging.error(e.response.text)
             raise e
+
+        return len(changed)
+
+    def provision(self, index_pattern: str, ndjson: str, default_route: str, recreate: bool=False):
+        """
+        provision the index pattern, the dashboard saved objects and the default route
+
+        :param index_pattern: title of the index pattern
+        :param ndjson: dashboard export
+        :param default_route: kibana default route
+        :param recreate: delete the index pattern before creating it
+        :return:
+        """
+
+        if recreate:
+            self.delete_index_pattern(title=index_pattern)
+
+        self.create_index_pattern(title=index_pattern)
+        self.import_dashboard(ndjson=ndjson)
+        self.set_default_route(path=default_route)
@@ -0,0 +1,63 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TransportSettings(object):
+    """
+        shared http transport configuration for the elasticsearch and kibana clients
+    """
+
+    def __init__(self, concurrency: int=4, compress: bool=True, timeout: float=30, sniff: bool=False, max_retries: int=3):
+        """
+        :param concurrency: number of parallel indexing workers, the connection pools are sized to match
+        :param compress: gzip compress request bodies (bulk payloads) sent to elasticsearch
+        :param timeout: request timeout in seconds
+        :param sniff: discover the elasticsearch cluster nodes on startup and on node failures
+        :param max_retries: number of retries for failed requests
+        """
+
+        self.concurrency = concurrency
+        self.compress = compress
+        self.timeout = timeout
+        self.sniff = sniff
+        self.max_retries = max_retries
+
+    def get_elasticsearch_options(self):
+        """
+        return the keyword arguments for the elasticsearch client.
+        if multiple hosts are given the client sends requests round-robin to all of them
+
+        :return: dictionary with client options
+        """
+
+        return dict(
+            http_compress=self.compress,
+            connections_per_node=self.concurrency,
+            request_timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_on_timeout=True,
+            node_selector_class='round_robin',
+            # no sniffing on start, it runs in the client constructor and fails while the cluster is still starting.
+            # the initial sniff is done by the caller once the cluster answers
+            sniff_on_node_failure=self.sniff,
+        )
+
+    def get_requests_session(self):
+        """
+        return a requests session with a keep-alive connection pool sized to the concurrency
+
+        :return: requests session
+        """
+
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency,
+            max_retries=Retry(total=self.max_retries, backoff_factor=0.5, status_forcelist=[502, 503, 504], allowed_methods=None),
+        )
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
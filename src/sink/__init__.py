@@ -0,0 +1 @@
+from .sinks import Sink, ElasticsearchSink, NullSink, NdjsonSink, FileSink, get_sink
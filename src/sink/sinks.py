@@ -0,0 +1,240 @@
+import logging
+import sys
+import threading
+import time
+
+from es import ElasticManagement, get_bulk_lines
+from transcript import ShowPlugin
+
+
+class Sink(object):
+    """
+        destination for the parsed transcript lines.
+        keeps track of the written documents and bytes to report the throughput of a run
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.documents = 0
+        self.bytes = 0
+        # the clock starts with the first episode, the preparation (index creation, kibana) is not part of the throughput
+        self.started = None
+
+    def prepare(self, show: ShowPlugin, recreate: bool):
+        """
+        prepare the sink for the documents of the given show
+        :param show:
+        :param recreate: delete existing data of the show
+        :return:
+        """
+
+        pass
+
+    def write_episode(self, show: ShowPlugin, episode, documents: list, generation: int, start: int=0, on_acknowledged=None):
+        """
+        write all transcript lines of the given episode
+        :param show: the show the episode belongs to
+        :param episode:
+        :param documents: the transcript lines of the episode, list of dictionaries with the keys document_id and document
+        :param generation: the generation of the import
+        :param start: skip the transcript lines already acknowledged by a previous run
+        :param on_acknowledged: optional callback, called with the number of acknowledged lines
+        :return:
+        """
+
+        raise NotImplementedError()
+
+    def close(self):
+        """
+        flush and close the sink
+        :return:
+        """
+
+        pass
+
+    def _get_bulk_lines(self, show: ShowPlugin, documents: list, generation: int):
+        """
+        serialize the given documents the same way they are sent to the bulk api of elasticsearch
+        :param show: the show the documents belong to
+        :param documents: list of dictionaries with the keys document_id and document
+        :param generation: the generation of the import
+        :return: list of encoded lines, action and document line per document
+        """
+
+        lines = list()
+        for d in documents:
+            lines.extend(get_bulk_lines(
+                index_name=show.index.index_name,
+                document=dict(d, document=dict(d.get('document'), generation=generation)),
+                routing_field=show.routing_field
+            ))
+
+        return lines
+
+    def _start(self):
+        """
+        start the clock for the throughput statistics, called when an episode is written
+        :return:
+        """
+
+        with self.lock:
+            if self.started is None:
+                self.started = time.monotonic()
+
+    def _count(self, documents: int, size: int):
+        """
+        add the given number of documents and bytes to the statistics
+        :param documents:
+        :param size: bytes
+        :return:
+        """
+
+        with self.lock:
+            self.documents += documents
+            self.bytes += size
+
+    def get_stats(self):
+        """
+        return the statistics of the sink
+        :return: dictionary with documents, bytes, seconds and the rates per second
+        """
+
+        seconds = time.monotonic() - self.started if self.started is not None else 0
+
+        return dict(
+            documents=self.documents,
+            bytes=self.bytes,
+            seconds=round(seconds, 3),
+            documents_per_second=round(self.documents / seconds, 1) if seconds else 0,
+            bytes_per_second=round(self.bytes / seconds, 1) if seconds else 0,
+        )
+
+
+class ElasticsearchSink(Sink):
+    """
+        write the transcript lines to the show indices in elasticsearch
+    """
+
+    def __init__(self, em: ElasticManagement):
+        """
+        :param em: shared elasticsearch connection
+        """
+
+        super().__init__()
+        self.em = em
+
+    def prepare(self, show: ShowPlugin, recreate: bool):
+        if recreate:
+            # delete indexes
+            self.em.delete_index(index_name=show.index.index_name)
+
+        # create indices
+        self.em.create_index(index_name=show.index.index_name, mappings=show.index.index_mappings, settings=show.get_index_settings())
+
+    def write_episode(self, show: ShowPlugin, episode, documents: list, generation: int, start: int=0, on_acknowledged=None):
+        self._start()
+
+        # add all transcript lines to the transcript index and remove the stale lines
+        deleted, size = self.em.replace_episode(
+            index_name=show.index.index_name,
+            documents=documents,
+            episode_field=show.episode_field,
+            episode=getattr(episode, show.episode_field),
+            generation=generation,
+            start=start,
+            on_acknowledged=on_acknowledged,
+            routing_field=show.routing_field
+        )
+
+        if deleted:
+            logging.info(f'Removed {deleted} stale documents of episode {getattr(episode, show.episode_field)} from index {show.index.index_name}')
+
+        self._count(len(documents) - start, size)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['batching'] = self.em.batch_controller.get_state()
+
+        return stats
+
+
+class NullSink(Sink):
+    """
+        serialize the transcript lines and throw them away, used to measure the parser throughput
+    """
+
+    def write_episode(self, show: ShowPlugin, episode, documents: list, generation: int, start: int=0, on_acknowledged=None):
+        self._start()
+        documents = documents[start:]
+
+        # every line is terminated by a newline
+        self._count(len(documents), sum(len(l) + 1 for l in self._get_bulk_lines(show, documents, generation)))
+
+
+class NdjsonSink(Sink):
+    """
+        write the transcript lines in the elasticsearch bulk format (action and document line),
+        the output can be sent to the _bulk api as is
+    """
+
+    def __init__(self, stream):
+        """
+        :param stream: writable text stream
+        """
+
+        super().__init__()
+        self.stream = stream
+
+    def write_episode(self, show: ShowPlugin, episode, documents: list, generation: int, start: int=0, on_acknowledged=None):
+        self._start()
+        documents = documents[start:]
+
+        data = b''.join(l + b'\n' for l in self._get_bulk_lines(show, documents, generation))
+
+        # episodes are written by multiple workers, make sure the lines of an episode stay together
+        with self.lock:
+            self.stream.write(data.decode())
+
+        self._count(len(documents), len(data))
+
+    def close(self):
+        self.stream.flush()
+
+
+class FileSink(NdjsonSink):
+    """
+        write the transcript lines to a ndjson file
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: path to the ndjson file, an existing file is overwritten
+        """
+
+        super().__init__(stream=open(path, 'w'))
+
+    def close(self):
+        self.stream.close()
+
+
+def get_sink(name: str, em: ElasticManagement=None, path: str=None):
+    """
+    return the sink with the given name
+    :param name: elasticsearch, null, stdout or file
+    :param em: elasticsearch connection, required for the elasticsearch sink
+    :param path: path to the output file, required for the file sink
+    :return: sink
+    """
+
+    if name == 'elasticsearch':
+        return ElasticsearchSink(em=em)
+    if name == 'null':
+        return NullSink()
+    if name == 'stdout':
+        return NdjsonSink(stream=sys.stdout)
+    if name == 'file':
+        if not path:
+            raise ValueError('The file sink requires an output file')
+        return FileSink(path=path)
+
+    raise ValueError(f'Unknown sink {name}')
@@ -2,88 +2,84 @@
 import click
 import sys
 import logging
-import os
-import glob
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from transcript import MagnusEpisode, MagnusTranscriptIndex
-from es import ElasticManagement, KibanaManagement
+from transcript import ShowPlugin, get_show, get_show_names, get_files_to_parse_per_show, CorpusStoreWriter, enrich_documents
+from es import ElasticManagement, KibanaManagement, TransportSettings, ImportCheckpoint, BulkBatchController
+from sink import Sink, get_sink
+from analytics import NgramCollector, CharacterGraphCollector
 
-def initialize_elasticsearch_for_magnus_archives(host: str, recreate_indices: bool):
+def initialize_kibana(host: str, shows: list, recreate_kibana_views: bool, spaces: list, transport: TransportSettings):
     """
-    setup elasticsearch indices
+    setup kibana data views and dashboards for the given shows.
+    the default route points to the dashboard of the first show
     :return:
     """
-    em = ElasticManagement(host=host)
 
-    if recreate_indices:
-        # delete indexes
-        em.delete_index(index_name=MagnusTranscriptIndex.index_name)
+    # all spaces are provisioned with the same session to reuse the pooled connections
+    session = transport.get_requests_session()
 
-    # create indices
-    em.create_index(index_name=MagnusTranscriptIndex.index_name, mappings=MagnusTranscriptIndex.index_mappings, settings=MagnusTranscriptIndex.index_settings)
+    for space in spaces if spaces else [None]:
+        km = KibanaManagement(host=host, space=space, session=session, transport=transport)
+        for show in reversed(shows):
+            km.provision(
+                index_pattern=show.index.index_name,
+                ndjson=show.index.kibana_dashboard,
+                default_route=show.index.kibana_default_route,
+                recreate=recreate_kibana_views
+            )
 
-def initialize_kibana_for_magnus_archives(host: str, recreate_kibana_views: bool):
+def parse_and_index_file(sink: Sink, show: ShowPlugin, path: str, generation: int, checkpoint: ImportCheckpoint=None, collectors: list=None):
     """
-    setup kibana data views
+    parse the given file and send it to the sink
+    :param sink: shared sink for all documents
+    :param show: the show the file belongs to
+    :param path: path to docx
+    :param generation: the generation of the import
+    :param checkpoint: optional checkpoint journal to skip or resume already imported files
+    :param collectors: optional analytics stages, every parsed episode is added to them
     :return:
     """
-    km = KibanaManagement(host=host)
-
-    if recreate_kibana_views:
-        km.delete_index_pattern(title=MagnusTranscriptIndex.index_name)
-
-    km.create_index_pattern(title=MagnusTranscriptIndex.index_name)
-
-    km.import_dashboard(ndjson=MagnusTranscriptIndex.kibana_dashboard)
-
-    km.set_default_route(path=MagnusTranscriptIndex.kibana_default_route)
-
-def get_files_to_parse(path: str):
-    """
-    check if the given path is a file or a folder
-    if a folder return all documents in the folder, else just return the file
-    :param path: path to file or folder
-    :return: list of paths
-    """
 
-    # if the given path is a file, return it
-    if os.path.isfile(path):
-        return [path]
+    try:
+        # the analytics stages need all episodes, so already imported files are still parsed for them
+        if checkpoint and checkpoint.is_completed(path) and not collectors:
+            logging.info(f'Skip document {path}, already imported')
+            return
 
-    # if a directory get all docx files in all subfolders
-    files = list()
-    for f in glob.glob(os.path.join(path, '**', '*.docx'), recursive=True):
-        files.append(f)
+        parsed_file = show.parse(path)
 
-    return files
+        for c in collectors or list():
+            c.add_episode(show=show, episode=parsed_file)
 
+        if checkpoint and checkpoint.is_completed(path):
+            logging.info(f'Skip indexing document {path}, already imported')
+            return
 
-def parse_file_for_magnus_archives(path: str):
-    """
-    parse the given file
-    :param path: path to docx
-    :return: MagnusEpside
-    """
+        # the line statistics are computed here once instead of analyzing the lines in elasticsearch
+        documents = enrich_documents(parsed_file.get_transcript_lines_for_index())
 
-    return MagnusEpisode(doc=path)
-
-def index_episode_for_magnus_archives(host: str, episode: MagnusEpisode):
-    """
-    send episode to elasitcsearch
-    :param episode:
-    :return:
-    """
-
-    em = ElasticManagement(host=host)
-
-    # add all transcript lines to the transcript index
-    for l in episode.get_transcript_lines_for_index():
-        em.feed_index(index_name=MagnusTranscriptIndex.index_name, data=l.get('document'), id=l.get('document_id'))
+        if checkpoint:
+            # a resumed file continues with the generation of the interrupted import
+            generation = checkpoint.get_generation(path) or generation
+            sink.write_episode(
+                show=show,
+                episode=parsed_file,
+                documents=documents,
+                generation=generation,
+                start=checkpoint.get_acknowledged(path),
+                on_acknowledged=lambda acknowledged: checkpoint.acknowledge(path, acknowledged, generation)
+            )
+            checkpoint.complete(path)
+        else:
+            sink.write_episode(show=show, episode=parsed_file, documents=documents, generation=generation)
+    except BaseException as e:
+        logging.warning(f'Unable to parse or index document {path}: {e}')
 
 @click.command()
 @click.argument(
     'path',
-    type=click.Path(exists=True),
     nargs=-1
 )
 @click.option(
@@ -115,11 +111,13 @@ def index_episode_for_magnus_archives(host: str, episode: MagnusEpisode):
 )
 @click.option(
     '--show',
+    'show_names',
     required=True,
     envvar='SHOW',
-    default='magnus',
-    type=click.Choice(['magnus']),
-    help='Transcripts are parsed for which show?',
+    multiple=True,
+    default=['magnus'],
+    type=click.Choice(get_show_names()),
+    help='Transcripts are parsed for which show? Can be given multiple times, paths are then prefixed with the show (magnus=/transcripts/magnus)',
     show_default=True
 )
 @click.option(
@@ -127,7 +125,7 @@ def index_episode_for_magnus_archives(host: str, episode: MagnusEpisode):
     required=True,
     envvar='ES_URL',
     default='http://localhost:9200',
-    help='The elasticsearch url used by the script to send data',
+    help='The elasticsearch url used by the script to send data, multiple urls can be given comma separated',
     show_default=True
 )
 @click.option(
@@ -138,7 +136,133 @@ def index_episode_for_magnus_archives(host: str, episode: MagnusEpisode):
     help='The elasticsearch url used by the script to send data',
     show_default=True
 )
-def run(path, loglevel, recreate_indices, recreate_kibana_views, show, elasticsearch_url, kibana_url):
+@click.option(
+    '--kibana-space',
+    'kibana_spaces',
+    required=False,
+    envvar='KB_SPACES',
+    multiple=True,
+    help='The kibana spaces to provision, can be given multiple times. Uses the default space if not set',
+    show_default=True
+)
+@click.option(
+    '--concurrency',
+    required=False,
+    envvar='CONCURRENCY',
+    type=click.IntRange(min=1),
+    default=4,
+    help='Number of documents parsed and indexed in parallel, the connection pools are sized to match',
+    show_default=True
+)
+@click.option(
+    '--http-compress/--no-http-compress',
+    required=False,
+    envvar='HTTP_COMPRESS',
+    default=True,
+    help='Gzip compress the bulk requests sent to elasticsearch',
+    show_default=True
+)
+@click.option(
+    '--http-timeout',
+    required=False,
+    envvar='HTTP_TIMEOUT',
+    type=float,
+    default=30,
+    help='Timeout in seconds for requests to elasticsearch and kibana',
+    show_default=True
+)
+@click.option(
+    '--sniff-nodes',
+    required=False,
+    envvar='SNIFF_NODES',
+    is_flag=True,
+    default=False,
+    help='Discover all elasticsearch cluster nodes and spread the requests over them',
+    show_default=True
+)
+@click.option(
+    '--bulk-target-latency',
+    required=False,
+    envvar='BULK_TARGET_LATENCY',
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    help='Target response time in seconds for bulk requests, the batch size grows while requests are faster and shrinks if they are slower',
+    show_default=True
+)
+@click.option(
+    '--bulk-max-bytes',
+    required=False,
+    envvar='BULK_MAX_BYTES',
+    type=click.IntRange(min=1024),
+    default=16 * 1024 * 1024,
+    help='Maximum payload size of a bulk request in bytes',
+    show_default=True
+)
+@click.option(
+    '--sink',
+    'sink_name',
+    required=False,
+    envvar='SINK',
+    type=click.Choice(['elasticsearch', 'null', 'stdout', 'file']),
+    default='elasticsearch',
+    help='Where to send the parsed documents. stdout and file write the elasticsearch bulk format, null only serializes the documents',
+    show_default=True
+)
+@click.option(
+    '--sink-file',
+    required=False,
+    envvar='SINK_FILE',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Output file for the file sink',
+    show_default=True
+)
+@click.option(
+    '--dry-run',
+    required=False,
+    envvar='DRY_RUN',
+    is_flag=True,
+    default=False,
+    help='Parse and serialize all documents without sending them anywhere and report the throughput, same as --sink null',
+    show_default=True
+)
+@click.option(
+    '--ngram-output',
+    required=False,
+    envvar='NGRAM_OUTPUT',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write the n-gram frequencies per character, episode and season of the spoken lines to the given file (numpy .npz)',
+    show_default=True
+)
+@click.option(
+    '--character-graph-output',
+    required=False,
+    envvar='CHARACTER_GRAPH_OUTPUT',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write the number of shared episodes and turns between every pair of characters to the given json file',
+    show_default=True
+)
+@click.option(
+    '--corpus-store',
+    required=False,
+    envvar='CORPUS_STORE',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write all parsed episodes to the given binary corpus store file, which can be memory mapped for fast reloading',
+    show_default=True
+)
+@click.option(
+    '--checkpoint-file',
+    required=False,
+    envvar='CHECKPOINT_FILE',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Journal of the imported documents. If given, an interrupted import resumes where it stopped',
+    show_default=True
+)
+def run(path, loglevel, recreate_indices, recreate_kibana_views, show_names, elasticsearch_url, kibana_url, kibana_spaces, concurrency, http_compress, http_timeout, sniff_nodes, bulk_target_latency, bulk_max_bytes, checkpoint_file, sink_name, sink_file, dry_run, ngram_output, character_graph_output, corpus_store):
     """
     setup elasticsearch and run indexing for a single document or folder
 
@@ -155,22 +279,66 @@ def run(path, loglevel, recreate_indices, recreate_kibana_views, show, elasticse
     # get all files to parse,
     # if the given filename is a folder, loop over all files in the folder,
     # if its just a single file, get back the single file
-    files_to_parse = list()
-    for p in path:
-        files_to_parse.extend(get_files_to_parse(p))
-
-    # depending on the show we may use different setup and parsing functions
-    # at the moment the script only supports magnus archive. but better be prepared!
-    if show == 'magnus':
-        initialize_elasticsearch_for_magnus_archives(recreate_indices=recreate_indices, host=elasticsearch_url)
-        initialize_kibana_for_magnus_archives(recreate_kibana_views=recreate_kibana_views, host=kibana_url)
-
-        for f in files_to_parse:
-            try:
-                parsed_file = parse_file_for_magnus_archives(f)
-                index_episode_for_magnus_archives(episode=parsed_file, host=elasticsearch_url)
-            except BaseException as e:
-                logging.warning(f'Unable to parse or index document {f}: {e}')
+    shows = [get_show(name) for name in show_names]
+    files_to_parse = get_files_to_parse_per_show(paths=path, shows=shows)
+
+    if dry_run:
+        sink_name = 'null'
+
+    # all requests share the same transport settings and the connection pools
+    transport = TransportSettings(concurrency=concurrency, compress=http_compress, timeout=http_timeout, sniff=sniff_nodes)
+
+    # elasticsearch and kibana are only required if the documents are sent to elasticsearch
+    em = None
+    checkpoint = None
+    if sink_name == 'elasticsearch':
+        batch_controller = BulkBatchController(target_latency=bulk_target_latency, max_bytes=bulk_max_bytes)
+        em = ElasticManagement(host=elasticsearch_url, transport=transport, batch_controller=batch_controller)
+
+        checkpoint = ImportCheckpoint(path=checkpoint_file) if checkpoint_file else None
+        # if the indices are recreated nothing is imported yet
+        if checkpoint and recreate_indices:
+            checkpoint.reset()
+    elif checkpoint_file:
+        logging.warning(f'The checkpoint file is only used with the elasticsearch sink, ignoring {checkpoint_file}')
+
+    sink = get_sink(name=sink_name, em=em, path=sink_file)
+
+    # every show brings its own parser, index and dashboard.
+    # all files of all shows are parsed and indexed by the same workers
+    for show in shows:
+        sink.prepare(show=show, recreate=recreate_indices)
+    if sink_name == 'elasticsearch':
+        initialize_kibana(recreate_kibana_views=recreate_kibana_views, host=kibana_url, shows=shows, spaces=kibana_spaces, transport=transport)
+
+    # analytics stages which are fed with every parsed episode
+    collectors = list()
+    if ngram_output:
+        collectors.append(NgramCollector(path=ngram_output))
+    if character_graph_output:
+        collectors.append(CharacterGraphCollector(path=character_graph_output))
+    if corpus_store:
+        collectors.append(CorpusStoreWriter(path=corpus_store))
+
+    # all documents written by this run are tagged with the same generation,
+    # documents of older generations are removed per episode after the episode is written
+    generation = time.time_ns() // 1000000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for show, f in files_to_parse:
+            executor.submit(parse_and_index_file, sink=sink, show=show, path=f, generation=generation, checkpoint=checkpoint, collectors=collectors)
+
+    sink.close()
+    # the statistics only cover the documents, not writing the analytics outputs
+    stats = sink.get_stats()
+
+    for c in collectors:
+        c.write()
+
+    logging.info(f'Wrote {stats["documents"]} documents ({stats["bytes"]} bytes) to the {sink_name} sink in {stats["seconds"]}s, '
+                 f'{stats["documents_per_second"]} documents/s, {stats["bytes_per_second"]} bytes/s')
+    if 'batching' in stats:
+        logging.info(f'Bulk batching: {stats["batching"]}')
 
 if __name__ == '__main__':
     try:
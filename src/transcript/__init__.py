@@ -1 +1,14 @@
-from .magnusarchives import MagnusEpisode, MagnusTranscriptIndex
\ No newline at end of file
+from .registry import ShowPlugin, register_show, get_show, get_show_names
+from .files import get_files_to_parse, get_files_to_parse_per_show
+from .validation import get_validation_report
+from .store import CorpusStore, CorpusStoreWriter
+from .enrichment import enrich_documents, tokenize
+
+
+def __getattr__(name):
+    # the show modules are imported lazily, startup only imports the selected shows
+    if name in ('MagnusEpisode', 'MagnusTranscriptIndex'):
+        from . import magnusarchives
+        return getattr(magnusarchives, name)
+
+    raise AttributeError(f'module {__name__} has no attribute {name}')
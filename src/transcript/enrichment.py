@@ -0,0 +1,52 @@
+import hashlib
+import re
+
+word_pattern = re.compile(r"[\w']+")
+sentence_end_pattern = re.compile(r'[.!?]+')
+normalize_pattern = re.compile(r"[^\w\s]+")
+
+
+def tokenize(line: str):
+    """
+    split the given line into words, shared by all stages counting words so their counts agree
+    :param line:
+    :return: list of words
+    """
+
+    return word_pattern.findall(line)
+
+
+def get_line_hash(line: str):
+    """
+    return a hash of the normalized line (lowercase, without punctuation and repeated whitespaces),
+    lines differing only in case or punctuation get the same hash
+
+    :param line:
+    :return: hex digest
+    """
+
+    normalized = ' '.join(normalize_pattern.sub(' ', line.lower()).split())
+
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+def enrich_documents(documents: list):
+    """
+    add the line statistics to the given documents. the statistics are computed once while importing
+    instead of analyzing every line in elasticsearch
+
+    :param documents: list of dictionaries with the keys document_id and document
+    :return: the documents with the fields line_word_count, line_char_count, line_sentence_count and line_hash
+    """
+
+    for d in documents:
+        line = d.get('document').get('line') or ''
+
+        d['document'].update(
+            line_word_count=len(tokenize(line)),
+            line_char_count=len(line),
+            line_sentence_count=len([s for s in sentence_end_pattern.split(line) if word_pattern.search(s)]),
+            line_hash=get_line_hash(line),
+        )
+
+    return documents
@@ -0,0 +1,49 @@
+import glob
+import os
+
+
+def get_files_to_parse(path: str):
+    """
+    check if the given path is a file or a folder
+    if a folder return all documents in the folder, else just return the file
+    :param path: path to file or folder
+    :return: list of paths
+    """
+
+    # if the given path is a file, return it
+    if os.path.isfile(path):
+        return [path]
+
+    # if a directory get all docx files in all subfolders
+    files = list()
+    for f in glob.glob(os.path.join(path, '**', '*.docx'), recursive=True):
+        files.append(f)
+
+    return files
+
+def get_files_to_parse_per_show(paths: list, shows: list):
+    """
+    assign the given paths to the shows. a path can be prefixed with the show name (magnus=/transcripts/magnus),
+    paths without prefix belong to the show if only a single show is selected
+
+    :param paths: list of paths, optional prefixed with the show name
+    :param shows: list of selected shows
+    :return: list of (show, path) tuples
+    """
+
+    shows_by_name = {s.name: s for s in shows}
+
+    files = list()
+    for p in paths:
+        name, separator, path = p.partition('=')
+        if not separator or name not in shows_by_name:
+            if len(shows) > 1:
+                raise ValueError(f'Path {p} needs to be prefixed with one of the selected shows ({", ".join(shows_by_name)}), e.g. {shows[0].name}={p}')
+            name, path = shows[0].name, p
+
+        if not os.path.exists(path):
+            raise ValueError(f'Path {path} does not exist')
+
+        files.extend((shows_by_name[name], f) for f in get_files_to_parse(path))
+
+    return files
@@ -48,24 +48,34 @@ class MagnusTranscriptIndex(object):
             ),
             line=dict(
                 type='text',
-                fields=dict(
-                    length=dict(
-                        type="token_count",
-                        analyzer="english"
-                    )
-                )
+            ),
+            # the line statistics are computed while importing, see transcript.enrichment
+            line_word_count=dict(
+                type='integer',
+            ),
+            line_char_count=dict(
+                type='integer',
+            ),
+            line_sentence_count=dict(
+                type='integer',
+            ),
+            line_hash=dict(
+                type='keyword',
+            ),
+            generation=dict(
+                type='long',
             ),
         ),
     )
     # exported via kibana gui -> stack management -> saved objects
     kibana_dashboard = r'''
     {"attributes":{"fieldAttrs":"{\"characters\":{\"count\":2}}","fields":"[]","runtimeFieldMap":"{}","title":"the_magnus_archives_transcripts","typeMeta":"{}"},"coreMigrationVersion":"8.1.2","id":"the_magnus_archives_transcripts","migrationVersion":{"index-pattern":"8.0.0"},"references":[],"type":"index-pattern","updated_at":"2022-04-17T08:40:20.832Z","version":"WzcxMTQsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 1\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"2db23deb-f500-485a-891c-527c3ee5c3f2\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"2db23deb-f500-485a-891c-527c3ee5c3f2\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"fd706bc8-0d44-445f-867a-ee6dd11e86f5\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"ff0005d8-6290-4da2-a41e-b7b0f4a8f429\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"fd706bc8-0d44-445f-867a-ee6dd11e86f5\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"ff0005d8-6290-4da2-a41e-b7b0f4a8f429\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"50d050b5-9733-4acd-8a04-e1224938fd84\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"6f8b560d-1761-4147-a63e-d191e6b73368\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"50d050b5-9733-4acd-8a04-e1224938fd84\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"6f8b560d-1761-4147-a63e-d191e6b73368\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"9d264f27-83b7-4bf5-936b-53c965043891\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"64a1b5f7-27d3-4625-8f15-0472eba7c7e0\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"9d264f27-83b7-4bf5-936b-53c965043891\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"64a1b5f7-27d3-4625-8f15-0472eba7c7e0\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"534190cd-364b-453c-81a1-348daa187c56\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"4591a794-488d-426e-84bf-74161332b8ae\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"534190cd-364b-453c-81a1-348daa187c56\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"4591a794-488d-426e-84bf-74161332b8ae\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b1f866ef-2191-4b82-ab76-be092c485c4c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"76544dc8-05a5-40a8-95aa-2098b600e8ab\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b1f866ef-2191-4b82-ab76-be092c485c4c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"76544dc8-05a5-40a8-95aa-2098b600e8ab\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 1","version":1},"coreMigrationVersion":"8.1.2","id":"67077000-be29-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:2db23deb-f500-485a-891c-527c3ee5c3f2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:fd706bc8-0d44-445f-867a-ee6dd11e86f5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:ff0005d8-6290-4da2-a41e-b7b0f4a8f429","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:50d050b5-9733-4acd-8a04-e1224938fd84","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:6f8b560d-1761-4147-a63e-d191e6b73368","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:9d264f27-83b7-4bf5-936b-53c965043891","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:64a1b5f7-27d3-4625-8f15-0472eba7c7e0","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:534190cd-364b-453c-81a1-348daa187c56","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:4591a794-488d-426e-84bf-74161332b8ae","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b1f866ef-2191-4b82-ab76-be092c485c4c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:76544dc8-05a5-40a8-95aa-2098b600e8ab","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:40:20.832Z","version":"WzcxMTYsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 2\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"8533ea82-799e-4924-9165-afe273a9552c\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"8533ea82-799e-4924-9165-afe273a9552c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"1bed5169-1040-42c8-a899-853e26516e3c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"0694aaf8-1d8d-4486-835f-23761fb62b4c\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"1bed5169-1040-42c8-a899-853e26516e3c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"0694aaf8-1d8d-4486-835f-23761fb62b4c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"cf502e9f-83d1-4564-91db-8822fb1bfaff\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"8ae6bafa-3b89-490b-b178-b5f232ce4311\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"cf502e9f-83d1-4564-91db-8822fb1bfaff\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"8ae6bafa-3b89-490b-b178-b5f232ce4311\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"c48f302b-9c1c-447a-af60-377b6fa74f09\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"f9b338fe-b7b9-43cb-b0b4-6a918bf0769a\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"c48f302b-9c1c-447a-af60-377b6fa74f09\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"f9b338fe-b7b9-43cb-b0b4-6a918bf0769a\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"7d4628b1-f8b2-455e-a09a-94482ef83c87\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"6d4c435c-2dcc-43bf-91a8-3afb6de2b950\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"7d4628b1-f8b2-455e-a09a-94482ef83c87\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"6d4c435c-2dcc-43bf-91a8-3afb6de2b950\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b0fe3a52-54c2-40e8-ae42-16cd25f8e939\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"795348ae-31e1-4352-ad03-ea7d953f2e45\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b0fe3a52-54c2-40e8-ae42-16cd25f8e939\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"795348ae-31e1-4352-ad03-ea7d953f2e45\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"785651ea-9ca2-4281-ac31-3190334aba67\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"785651ea-9ca2-4281-ac31-3190334aba67\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 2","version":1},"coreMigrationVersion":"8.1.2","id":"8a05c2e0-be2a-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:8533ea82-799e-4924-9165-afe273a9552c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:1bed5169-1040-42c8-a899-853e26516e3c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:0694aaf8-1d8d-4486-835f-23761fb62b4c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:cf502e9f-83d1-4564-91db-8822fb1bfaff","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:8ae6bafa-3b89-490b-b178-b5f232ce4311","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:c48f302b-9c1c-447a-af60-377b6fa74f09","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:f9b338fe-b7b9-43cb-b0b4-6a918bf0769a","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:7d4628b1-f8b2-455e-a09a-94482ef83c87","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:6d4c435c-2dcc-43bf-91a8-3afb6de2b950","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b0fe3a52-54c2-40e8-ae42-16cd25f8e939","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:795348ae-31e1-4352-ad03-ea7d953f2e45","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:785651ea-9ca2-4281-ac31-3190334aba67","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:47:34.900Z","version":"Wzc0NjQsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 3\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"bdf979c0-8ecd-42a7-95e9-a6d605ab2035\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"bdf979c0-8ecd-42a7-95e9-a6d605ab2035\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"62a5e4ae-624b-48f3-b7cc-c7af8832ec53\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"60fcbb19-78de-49cc-8842-1c5468e46e97\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"62a5e4ae-624b-48f3-b7cc-c7af8832ec53\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"60fcbb19-78de-49cc-8842-1c5468e46e97\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"853f3ea1-ddff-4871-abab-816475f71bbf\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"c32d3415-0213-459c-b925-5de2f7697b9f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"853f3ea1-ddff-4871-abab-816475f71bbf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"c32d3415-0213-459c-b925-5de2f7697b9f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"15487065-6559-4530-ab9c-94cdf0a0d374\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"25ac588f-e048-4b0a-ab81-5cbb1ed7145f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"15487065-6559-4530-ab9c-94cdf0a0d374\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"25ac588f-e048-4b0a-ab81-5cbb1ed7145f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"b0e637b7-191f-4bc5-bf34-e02952fd4563\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"b0e637b7-191f-4bc5-bf34-e02952fd4563\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"17134934-7cab-48e3-bb71-9ded2ea1bcdf\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"118747c6-520d-4272-90ce-72d87a97052b\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"17134934-7cab-48e3-bb71-9ded2ea1bcdf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"118747c6-520d-4272-90ce-72d87a97052b\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"8bd93901-4b70-4932-945c-712f7ccdabfc\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"8bd93901-4b70-4932-945c-712f7ccdabfc\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 3","version":1},"coreMigrationVersion":"8.1.2","id":"1113bc60-be2b-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:bdf979c0-8ecd-42a7-95e9-a6d605ab2035","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:62a5e4ae-624b-48f3-b7cc-c7af8832ec53","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:60fcbb19-78de-49cc-8842-1c5468e46e97","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:853f3ea1-ddff-4871-abab-816475f71bbf","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:c32d3415-0213-459c-b925-5de2f7697b9f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:15487065-6559-4530-ab9c-94cdf0a0d374","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:25ac588f-e048-4b0a-ab81-5cbb1ed7145f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:b0e637b7-191f-4bc5-bf34-e02952fd4563","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:17134934-7cab-48e3-bb71-9ded2ea1bcdf","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:118747c6-520d-4272-90ce-72d87a97052b","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:8bd93901-4b70-4932-945c-712f7ccdabfc","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:49:40.304Z","version":"Wzc2MzIsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 4\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"dadcfc45-8555-4322-9156-84dc9f98e1f9\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"dadcfc45-8555-4322-9156-84dc9f98e1f9\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"52e967ca-4088-455c-9b52-3242bf74fdb3\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"8bddd2bc-9ce1-47cb-9098-2953862aff4f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"52e967ca-4088-455c-9b52-3242bf74fdb3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"8bddd2bc-9ce1-47cb-9098-2953862aff4f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"01187815-4461-4336-8414-4b4e2f1fe881\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"01187815-4461-4336-8414-4b4e2f1fe881\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"ae14e37c-2cba-48e0-a5db-6abb6266450c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"efdc35d9-65f4-475e-b8d0-927acbe21055\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"ae14e37c-2cba-48e0-a5db-6abb6266450c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"efdc35d9-65f4-475e-b8d0-927acbe21055\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"ba656d61-993c-4f5e-adf7-7e8644633bec\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"ba656d61-993c-4f5e-adf7-7e8644633bec\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b13d1847-4036-4d72-9a4c-8184f2ef712d\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"05790d25-ee7a-44df-89b1-0ec0a84e2192\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b13d1847-4036-4d72-9a4c-8184f2ef712d\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"05790d25-ee7a-44df-89b1-0ec0a84e2192\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"ec2d0f03-34a4-4458-81c4-7ed239bbfbdc\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"ec2d0f03-34a4-4458-81c4-7ed239bbfbdc\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 4","version":1},"coreMigrationVersion":"8.1.2","id":"ac9ca160-be2b-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:dadcfc45-8555-4322-9156-84dc9f98e1f9","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:52e967ca-4088-455c-9b52-3242bf74fdb3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:8bddd2bc-9ce1-47cb-9098-2953862aff4f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:01187815-4461-4336-8414-4b4e2f1fe881","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:ae14e37c-2cba-48e0-a5db-6abb6266450c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:efdc35d9-65f4-475e-b8d0-927acbe21055","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:ba656d61-993c-4f5e-adf7-7e8644633bec","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b13d1847-4036-4d72-9a4c-8184f2ef712d","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:05790d25-ee7a-44df-89b1-0ec0a84e2192","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:ec2d0f03-34a4-4458-81c4-7ed239bbfbdc","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:54:11.628Z","version":"Wzc5MDcsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 5\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"f0bb16eb-f2b3-401f-823e-e31d99d8282e\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"f0bb16eb-f2b3-401f-823e-e31d99d8282e\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"b3b8c1b6-a2f2-4521-9c68-056551a007f3\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"a468e121-9331-4329-be43-bf718fb8c290\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b3b8c1b6-a2f2-4521-9c68-056551a007f3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"a468e121-9331-4329-be43-bf718fb8c290\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"72c0184b-13ea-4372-82e3-e9d7e0f441de\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"0e85dc57-7f6f-4336-b406-6a7e9ba228e7\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"72c0184b-13ea-4372-82e3-e9d7e0f441de\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"0e85dc57-7f6f-4336-b406-6a7e9ba228e7\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"4a1b675c-56c8-425a-aed1-399478b40281\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"bb9d6223-df29-4d57-bdd5-91e8190676e9\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"4a1b675c-56c8-425a-aed1-399478b40281\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"bb9d6223-df29-4d57-bdd5-91e8190676e9\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"389c8803-30b0-4448-ae3f-072c25c47c66\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"2053342a-1fd8-4877-9d6e-0554982c917f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"389c8803-30b0-4448-ae3f-072c25c47c66\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"2053342a-1fd8-4877-9d6e-0554982c917f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"5c9739ca-9469-4db4-8344-c2207c9097e1\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"07645aa6-b12f-45e6-aad7-be2c1220ed8d\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"5c9739ca-9469-4db4-8344-c2207c9097e1\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"07645aa6-b12f-45e6-aad7-be2c1220ed8d\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"05c92b46-ef54-4530-869a-b3dea7ab7dbf\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"05c92b46-ef54-4530-869a-b3dea7ab7dbf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 5","version":1},"coreMigrationVersion":"8.1.2","id":"0dcb52b0-be2c-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:f0bb16eb-f2b3-401f-823e-e31d99d8282e","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:b3b8c1b6-a2f2-4521-9c68-056551a007f3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:a468e121-9331-4329-be43-bf718fb8c290","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:72c0184b-13ea-4372-82e3-e9d7e0f441de","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:0e85dc57-7f6f-4336-b406-6a7e9ba228e7","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:4a1b675c-56c8-425a-aed1-399478b40281","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:bb9d6223-df29-4d57-bdd5-91e8190676e9","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:389c8803-30b0-4448-ae3f-072c25c47c66","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:2053342a-1fd8-4877-9d6e-0554982c917f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:5c9739ca-9469-4db4-8344-c2207c9097e1","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:07645aa6-b12f-45e6-aad7-be2c1220ed8d","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:05c92b46-ef54-4530-869a-b3dea7ab7dbf","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:56:24.759Z","version":"WzgwODcsOF0="}
-    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":12,\"i\":\"dbe32f66-68dc-4113-88d0-d8b5dcda56fc\"},\"panelIndex\":\"dbe32f66-68dc-4113-88d0-d8b5dcda56fc\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"## All Seasons\\n\\nFor more details about the seasons navigate to their dashboards\\n\\n- [Season 1](/app/dashboards#/view/67077000-be29-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 2](/app/dashboards#/view/8a05c2e0-be2a-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 3](/app/dashboards#/view/1113bc60-be2b-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 4](/app/dashboards#/view/ac9ca160-be2b-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 5](/app/dashboards#/view/0dcb52b0-be2c-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":6,\"h\":12,\"i\":\"99da6270-2caf-4343-b636-875cf81afca9\"},\"panelIndex\":\"99da6270-2caf-4343-b636-875cf81afca9\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"189d3670-7e30-4b2a-892e-8334795188de\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"189d3670-7e30-4b2a-892e-8334795188de\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":28,\"y\":0,\"w\":4,\"h\":12,\"i\":\"e9bb11af-fd31-41f3-8776-962136ec98e3\"},\"panelIndex\":\"e9bb11af-fd31-41f3-8776-962136ec98e3\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"1010feb4-2196-4a01-b8d1-977485aaadb5\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"1010feb4-2196-4a01-b8d1-977485aaadb5\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":12,\"i\":\"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0\"},\"panelIndex\":\"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"b717c122-4a56-4e4c-9e1d-c470f54a3651\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b717c122-4a56-4e4c-9e1d-c470f54a3651\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":11,\"h\":12,\"i\":\"59e9a378-8916-4b13-86de-71baeadbf947\"},\"panelIndex\":\"59e9a378-8916-4b13-86de-71baeadbf947\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsDatatable\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"columns\":[{\"columnId\":\"b6d93e0c-794e-448b-bb44-6f90d0e02932\",\"isTransposed\":false},{\"columnId\":\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\",\"isTransposed\":false}],\"layerId\":\"9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\":{\"columns\":{\"b6d93e0c-794e-448b-bb44-6f90d0e02932\":{\"label\":\"Transcripts Parsed\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true},\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\":{\"label\":\"Season\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"season\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":\"auto\"},\"customLabel\":true}},\"columnOrder\":[\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\",\"b6d93e0c-794e-448b-bb44-6f90d0e02932\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Parsed Transcripts\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":12,\"w\":47,\"h\":42,\"i\":\"829f6b50-09c7-412e-9ffa-207b9e559068\"},\"panelIndex\":\"829f6b50-09c7-412e-9ffa-207b9e559068\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"7115f219-521f-461c-8fa6-62e4c047ae77\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"7115f219-521f-461c-8fa6-62e4c047ae77\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line.length\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":250,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":54,\"w\":47,\"h\":27,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"64253d25-2962-48be-8ac5-3f97da6874a3\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"64253d25-2962-48be-8ac5-3f97da6874a3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in all seasons\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":81,\"w\":47,\"h\":12,\"i\":\"acf834ce-775e-4fe1-8a0c-058496b054bf\"},\"panelIndex\":\"acf834ce-775e-4fe1-8a0c-058496b054bf\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Content Warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":25,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 25 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives Dashboard","version":1},"coreMigrationVersion":"8.1.2","id":"32c54d50-be13-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:189d3670-7e30-4b2a-892e-8334795188de","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:1010feb4-2196-4a01-b8d1-977485aaadb5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:b717c122-4a56-4e4c-9e1d-c470f54a3651","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"59e9a378-8916-4b13-86de-71baeadbf947:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"59e9a378-8916-4b13-86de-71baeadbf947:indexpattern-datasource-layer-9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:7115f219-521f-461c-8fa6-62e4c047ae77","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:64253d25-2962-48be-8ac5-3f97da6874a3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"acf834ce-775e-4fe1-8a0c-058496b054bf:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"acf834ce-775e-4fe1-8a0c-058496b054bf:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:57:10.399Z","version":"WzgxMjcsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 1\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"2db23deb-f500-485a-891c-527c3ee5c3f2\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"2db23deb-f500-485a-891c-527c3ee5c3f2\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"fd706bc8-0d44-445f-867a-ee6dd11e86f5\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"ff0005d8-6290-4da2-a41e-b7b0f4a8f429\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"fd706bc8-0d44-445f-867a-ee6dd11e86f5\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"ff0005d8-6290-4da2-a41e-b7b0f4a8f429\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"50d050b5-9733-4acd-8a04-e1224938fd84\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"6f8b560d-1761-4147-a63e-d191e6b73368\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"50d050b5-9733-4acd-8a04-e1224938fd84\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"6f8b560d-1761-4147-a63e-d191e6b73368\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"9d264f27-83b7-4bf5-936b-53c965043891\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"64a1b5f7-27d3-4625-8f15-0472eba7c7e0\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"9d264f27-83b7-4bf5-936b-53c965043891\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"64a1b5f7-27d3-4625-8f15-0472eba7c7e0\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"534190cd-364b-453c-81a1-348daa187c56\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"4591a794-488d-426e-84bf-74161332b8ae\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"534190cd-364b-453c-81a1-348daa187c56\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"4591a794-488d-426e-84bf-74161332b8ae\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b1f866ef-2191-4b82-ab76-be092c485c4c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"76544dc8-05a5-40a8-95aa-2098b600e8ab\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b1f866ef-2191-4b82-ab76-be092c485c4c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"76544dc8-05a5-40a8-95aa-2098b600e8ab\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":1}},\"query\":{\"match_phrase\":{\"season\":1}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 1","version":1},"coreMigrationVersion":"8.1.2","id":"67077000-be29-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:2db23deb-f500-485a-891c-527c3ee5c3f2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:fd706bc8-0d44-445f-867a-ee6dd11e86f5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:ff0005d8-6290-4da2-a41e-b7b0f4a8f429","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:50d050b5-9733-4acd-8a04-e1224938fd84","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:6f8b560d-1761-4147-a63e-d191e6b73368","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:9d264f27-83b7-4bf5-936b-53c965043891","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:64a1b5f7-27d3-4625-8f15-0472eba7c7e0","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:534190cd-364b-453c-81a1-348daa187c56","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:4591a794-488d-426e-84bf-74161332b8ae","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b1f866ef-2191-4b82-ab76-be092c485c4c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:76544dc8-05a5-40a8-95aa-2098b600e8ab","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:3cc7cbaf-6311-4f08-871c-8d86fa7bb5dd","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:40:20.832Z","version":"WzcxMTYsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 2\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"8533ea82-799e-4924-9165-afe273a9552c\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"8533ea82-799e-4924-9165-afe273a9552c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"1bed5169-1040-42c8-a899-853e26516e3c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"0694aaf8-1d8d-4486-835f-23761fb62b4c\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"1bed5169-1040-42c8-a899-853e26516e3c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"0694aaf8-1d8d-4486-835f-23761fb62b4c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"cf502e9f-83d1-4564-91db-8822fb1bfaff\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"8ae6bafa-3b89-490b-b178-b5f232ce4311\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"cf502e9f-83d1-4564-91db-8822fb1bfaff\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"8ae6bafa-3b89-490b-b178-b5f232ce4311\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"c48f302b-9c1c-447a-af60-377b6fa74f09\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"f9b338fe-b7b9-43cb-b0b4-6a918bf0769a\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"c48f302b-9c1c-447a-af60-377b6fa74f09\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"f9b338fe-b7b9-43cb-b0b4-6a918bf0769a\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"7d4628b1-f8b2-455e-a09a-94482ef83c87\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"6d4c435c-2dcc-43bf-91a8-3afb6de2b950\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"7d4628b1-f8b2-455e-a09a-94482ef83c87\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"6d4c435c-2dcc-43bf-91a8-3afb6de2b950\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b0fe3a52-54c2-40e8-ae42-16cd25f8e939\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"795348ae-31e1-4352-ad03-ea7d953f2e45\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b0fe3a52-54c2-40e8-ae42-16cd25f8e939\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"795348ae-31e1-4352-ad03-ea7d953f2e45\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"785651ea-9ca2-4281-ac31-3190334aba67\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"785651ea-9ca2-4281-ac31-3190334aba67\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":2}},\"query\":{\"match_phrase\":{\"season\":2}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 2","version":1},"coreMigrationVersion":"8.1.2","id":"8a05c2e0-be2a-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:8533ea82-799e-4924-9165-afe273a9552c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:1bed5169-1040-42c8-a899-853e26516e3c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:0694aaf8-1d8d-4486-835f-23761fb62b4c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:cf502e9f-83d1-4564-91db-8822fb1bfaff","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:8ae6bafa-3b89-490b-b178-b5f232ce4311","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:c48f302b-9c1c-447a-af60-377b6fa74f09","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:f9b338fe-b7b9-43cb-b0b4-6a918bf0769a","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:7d4628b1-f8b2-455e-a09a-94482ef83c87","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:6d4c435c-2dcc-43bf-91a8-3afb6de2b950","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b0fe3a52-54c2-40e8-ae42-16cd25f8e939","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:795348ae-31e1-4352-ad03-ea7d953f2e45","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:785651ea-9ca2-4281-ac31-3190334aba67","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:47:34.900Z","version":"Wzc0NjQsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 3\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"bdf979c0-8ecd-42a7-95e9-a6d605ab2035\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"bdf979c0-8ecd-42a7-95e9-a6d605ab2035\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"62a5e4ae-624b-48f3-b7cc-c7af8832ec53\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"60fcbb19-78de-49cc-8842-1c5468e46e97\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"62a5e4ae-624b-48f3-b7cc-c7af8832ec53\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"60fcbb19-78de-49cc-8842-1c5468e46e97\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"853f3ea1-ddff-4871-abab-816475f71bbf\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"c32d3415-0213-459c-b925-5de2f7697b9f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"853f3ea1-ddff-4871-abab-816475f71bbf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"c32d3415-0213-459c-b925-5de2f7697b9f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"15487065-6559-4530-ab9c-94cdf0a0d374\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"25ac588f-e048-4b0a-ab81-5cbb1ed7145f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"15487065-6559-4530-ab9c-94cdf0a0d374\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"25ac588f-e048-4b0a-ab81-5cbb1ed7145f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"b0e637b7-191f-4bc5-bf34-e02952fd4563\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"b0e637b7-191f-4bc5-bf34-e02952fd4563\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"17134934-7cab-48e3-bb71-9ded2ea1bcdf\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"118747c6-520d-4272-90ce-72d87a97052b\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"17134934-7cab-48e3-bb71-9ded2ea1bcdf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"118747c6-520d-4272-90ce-72d87a97052b\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"8bd93901-4b70-4932-945c-712f7ccdabfc\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"8bd93901-4b70-4932-945c-712f7ccdabfc\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":3}},\"query\":{\"match_phrase\":{\"season\":3}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 3","version":1},"coreMigrationVersion":"8.1.2","id":"1113bc60-be2b-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:bdf979c0-8ecd-42a7-95e9-a6d605ab2035","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:62a5e4ae-624b-48f3-b7cc-c7af8832ec53","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:60fcbb19-78de-49cc-8842-1c5468e46e97","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:853f3ea1-ddff-4871-abab-816475f71bbf","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:c32d3415-0213-459c-b925-5de2f7697b9f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:15487065-6559-4530-ab9c-94cdf0a0d374","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:25ac588f-e048-4b0a-ab81-5cbb1ed7145f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:bb7c3ebf-2ce2-4e8a-bbde-0d9691b7c234","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:b0e637b7-191f-4bc5-bf34-e02952fd4563","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:17134934-7cab-48e3-bb71-9ded2ea1bcdf","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:118747c6-520d-4272-90ce-72d87a97052b","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:8bd93901-4b70-4932-945c-712f7ccdabfc","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:49:40.304Z","version":"Wzc2MzIsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 4\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"dadcfc45-8555-4322-9156-84dc9f98e1f9\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"dadcfc45-8555-4322-9156-84dc9f98e1f9\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"52e967ca-4088-455c-9b52-3242bf74fdb3\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"8bddd2bc-9ce1-47cb-9098-2953862aff4f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"52e967ca-4088-455c-9b52-3242bf74fdb3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"8bddd2bc-9ce1-47cb-9098-2953862aff4f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"01187815-4461-4336-8414-4b4e2f1fe881\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"01187815-4461-4336-8414-4b4e2f1fe881\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"ae14e37c-2cba-48e0-a5db-6abb6266450c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"efdc35d9-65f4-475e-b8d0-927acbe21055\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"ae14e37c-2cba-48e0-a5db-6abb6266450c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"efdc35d9-65f4-475e-b8d0-927acbe21055\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"ba656d61-993c-4f5e-adf7-7e8644633bec\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"ba656d61-993c-4f5e-adf7-7e8644633bec\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"b13d1847-4036-4d72-9a4c-8184f2ef712d\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"05790d25-ee7a-44df-89b1-0ec0a84e2192\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b13d1847-4036-4d72-9a4c-8184f2ef712d\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"05790d25-ee7a-44df-89b1-0ec0a84e2192\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"ec2d0f03-34a4-4458-81c4-7ed239bbfbdc\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"ec2d0f03-34a4-4458-81c4-7ed239bbfbdc\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":4}},\"query\":{\"match_phrase\":{\"season\":4}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 4","version":1},"coreMigrationVersion":"8.1.2","id":"ac9ca160-be2b-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:dadcfc45-8555-4322-9156-84dc9f98e1f9","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:52e967ca-4088-455c-9b52-3242bf74fdb3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:8bddd2bc-9ce1-47cb-9098-2953862aff4f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:01187815-4461-4336-8414-4b4e2f1fe881","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:c2e1a01b-94e0-4016-8cc9-f1c9b4d4d75e","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:ae14e37c-2cba-48e0-a5db-6abb6266450c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:efdc35d9-65f4-475e-b8d0-927acbe21055","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:2435b5f7-7ea6-47c2-8ee8-314dffdd1b9c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:ba656d61-993c-4f5e-adf7-7e8644633bec","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:b13d1847-4036-4d72-9a4c-8184f2ef712d","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:05790d25-ee7a-44df-89b1-0ec0a84e2192","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:ec2d0f03-34a4-4458-81c4-7ed239bbfbdc","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:54:11.628Z","version":"Wzc5MDcsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":7,\"i\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\"},\"panelIndex\":\"8559bf68-0ea3-48bf-abec-c9883c6023d1\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"# Season 5\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":4,\"h\":7,\"i\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\"},\"panelIndex\":\"d9accb22-516a-45aa-a9d6-60b0d9761dbc\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144\"},{\"type\":\"index-pattern\",\"name\":\"f0bb16eb-f2b3-401f-823e-e31d99d8282e\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"74a386b7-030c-47a7-b7e4-d1daf9c66144\",\"accessor\":\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"f0bb16eb-f2b3-401f-823e-e31d99d8282e\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"74a386b7-030c-47a7-b7e4-d1daf9c66144\":{\"columns\":{\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\":{\"label\":\"Parsed Transcripts\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true}},\"columnOrder\":[\"7c12756c-461b-4a08-bef7-f68ad4efbd7b\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":true,\"enhancements\":{}}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":26,\"y\":0,\"w\":6,\"h\":7,\"i\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\"},\"panelIndex\":\"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"b3b8c1b6-a2f2-4521-9c68-056551a007f3\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"a468e121-9331-4329-be43-bf718fb8c290\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b3b8c1b6-a2f2-4521-9c68-056551a007f3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"a468e121-9331-4329-be43-bf718fb8c290\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":4,\"h\":7,\"i\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\"},\"panelIndex\":\"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"72c0184b-13ea-4372-82e3-e9d7e0f441de\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"0e85dc57-7f6f-4336-b406-6a7e9ba228e7\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"72c0184b-13ea-4372-82e3-e9d7e0f441de\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"0e85dc57-7f6f-4336-b406-6a7e9ba228e7\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":7,\"w\":22,\"h\":29,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"4a1b675c-56c8-425a-aed1-399478b40281\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"bb9d6223-df29-4d57-bdd5-91e8190676e9\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"4a1b675c-56c8-425a-aed1-399478b40281\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"bb9d6223-df29-4d57-bdd5-91e8190676e9\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in season\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":7,\"i\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\"},\"panelIndex\":\"613f0bda-3bb6-4142-a0fd-3f1e8939fe32\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\"},{\"type\":\"index-pattern\",\"name\":\"389c8803-30b0-4448-ae3f-072c25c47c66\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"2053342a-1fd8-4877-9d6e-0554982c917f\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"389c8803-30b0-4448-ae3f-072c25c47c66\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"2053342a-1fd8-4877-9d6e-0554982c917f\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":7,\"w\":25,\"h\":30,\"i\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\"},\"panelIndex\":\"bef97c14-bbd9-4b19-b586-8d9ab2b92821\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\"},{\"type\":\"index-pattern\",\"name\":\"5c9739ca-9469-4db4-8344-c2207c9097e1\",\"id\":\"the_magnus_archives_transcripts\"},{\"type\":\"index-pattern\",\"name\":\"07645aa6-b12f-45e6-aad7-be2c1220ed8d\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"5c9739ca-9469-4db4-8344-c2207c9097e1\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}},{\"meta\":{\"index\":\"07645aa6-b12f-45e6-aad7-be2c1220ed8d\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":37,\"w\":48,\"h\":8,\"i\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\"},\"panelIndex\":\"f00d6f52-e092-452c-a92a-c484584ab1c7\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\"},{\"type\":\"index-pattern\",\"name\":\"05c92b46-ef54-4530-869a-b3dea7ab7dbf\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"05c92b46-ef54-4530-869a-b3dea7ab7dbf\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"season\",\"params\":{\"query\":5}},\"query\":{\"match_phrase\":{\"season\":5}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Top values of content_warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":15,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 15 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives - Season 5","version":1},"coreMigrationVersion":"8.1.2","id":"0dcb52b0-be2c-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:indexpattern-datasource-layer-74a386b7-030c-47a7-b7e4-d1daf9c66144","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"d9accb22-516a-45aa-a9d6-60b0d9761dbc:f0bb16eb-f2b3-401f-823e-e31d99d8282e","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:b3b8c1b6-a2f2-4521-9c68-056551a007f3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"58a80bcc-2f57-4d1b-988e-ba04a1ff3a3d:a468e121-9331-4329-be43-bf718fb8c290","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:72c0184b-13ea-4372-82e3-e9d7e0f441de","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e38bcfdd-3c81-40b6-bc5d-3b2375b5fa38:0e85dc57-7f6f-4336-b406-6a7e9ba228e7","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:4a1b675c-56c8-425a-aed1-399478b40281","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:bb9d6223-df29-4d57-bdd5-91e8190676e9","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:389c8803-30b0-4448-ae3f-072c25c47c66","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"613f0bda-3bb6-4142-a0fd-3f1e8939fe32:2053342a-1fd8-4877-9d6e-0554982c917f","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:5c9739ca-9469-4db4-8344-c2207c9097e1","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"bef97c14-bbd9-4b19-b586-8d9ab2b92821:07645aa6-b12f-45e6-aad7-be2c1220ed8d","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"f00d6f52-e092-452c-a92a-c484584ab1c7:05c92b46-ef54-4530-869a-b3dea7ab7dbf","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:56:24.759Z","version":"WzgwODcsOF0="}
+    {"attributes":{"description":"","hits":0,"kibanaSavedObjectMeta":{"searchSourceJSON":"{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}"},"optionsJSON":"{\"useMargins\":true,\"syncColors\":false,\"hidePanelTitles\":false}","panelsJSON":"[{\"version\":\"8.1.2\",\"type\":\"visualization\",\"gridData\":{\"x\":0,\"y\":0,\"w\":22,\"h\":12,\"i\":\"dbe32f66-68dc-4113-88d0-d8b5dcda56fc\"},\"panelIndex\":\"dbe32f66-68dc-4113-88d0-d8b5dcda56fc\",\"embeddableConfig\":{\"savedVis\":{\"id\":\"\",\"title\":\"\",\"description\":\"\",\"type\":\"markdown\",\"params\":{\"fontSize\":12,\"openLinksInNewTab\":false,\"markdown\":\"## All Seasons\\n\\nFor more details about the seasons navigate to their dashboards\\n\\n- [Season 1](/app/dashboards#/view/67077000-be29-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 2](/app/dashboards#/view/8a05c2e0-be2a-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 3](/app/dashboards#/view/1113bc60-be2b-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 4](/app/dashboards#/view/ac9ca160-be2b-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\\n- [Season 5](/app/dashboards#/view/0dcb52b0-be2c-11ec-81b2-97a6366f6ba6?_g=(filters%3A!()%2CrefreshInterval%3A(pause%3A!t%2Cvalue%3A0)%2Ctime%3A(from%3Anow-15m%2Cto%3Anow)))\"},\"uiState\":{},\"data\":{\"aggs\":[],\"searchSource\":{\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filter\":[]}}},\"enhancements\":{},\"hidePanelTitles\":true}},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":22,\"y\":0,\"w\":6,\"h\":12,\"i\":\"99da6270-2caf-4343-b636-875cf81afca9\"},\"panelIndex\":\"99da6270-2caf-4343-b636-875cf81afca9\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"189d3670-7e30-4b2a-892e-8334795188de\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"189d3670-7e30-4b2a-892e-8334795188de\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Spoken words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":28,\"y\":0,\"w\":4,\"h\":12,\"i\":\"e9bb11af-fd31-41f3-8776-962136ec98e3\"},\"panelIndex\":\"e9bb11af-fd31-41f3-8776-962136ec98e3\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"1010feb4-2196-4a01-b8d1-977485aaadb5\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"1010feb4-2196-4a01-b8d1-977485aaadb5\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"sfx\"}},\"query\":{\"match_phrase\":{\"type\":\"sfx\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"SFX Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":32,\"y\":0,\"w\":4,\"h\":12,\"i\":\"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0\"},\"panelIndex\":\"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsMetric\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"b717c122-4a56-4e4c-9e1d-c470f54a3651\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"9d24c917-c05b-4b46-81b3-80fecd332556\",\"accessor\":\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\",\"layerType\":\"data\",\"colorMode\":\"None\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"b717c122-4a56-4e4c-9e1d-c470f54a3651\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"acting\"}},\"query\":{\"match_phrase\":{\"type\":\"acting\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9d24c917-c05b-4b46-81b3-80fecd332556\":{\"columns\":{\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\":{\"label\":\"Acting Instructions\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"customLabel\":true}},\"columnOrder\":[\"976d3c2c-3408-4b63-aa6f-3205cf85ec24\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":true},\"title\":\"\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":36,\"y\":0,\"w\":11,\"h\":12,\"i\":\"59e9a378-8916-4b13-86de-71baeadbf947\"},\"panelIndex\":\"59e9a378-8916-4b13-86de-71baeadbf947\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsDatatable\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"columns\":[{\"columnId\":\"b6d93e0c-794e-448b-bb44-6f90d0e02932\",\"isTransposed\":false},{\"columnId\":\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\",\"isTransposed\":false}],\"layerId\":\"9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\",\"layerType\":\"data\"},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5\":{\"columns\":{\"b6d93e0c-794e-448b-bb44-6f90d0e02932\":{\"label\":\"Transcripts Parsed\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"episode_number\",\"isBucketed\":false,\"customLabel\":true},\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\":{\"label\":\"Season\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"season\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":\"auto\"},\"customLabel\":true}},\"columnOrder\":[\"4fe72c8c-a6f0-481b-b56d-1650ac66f8aa\",\"b6d93e0c-794e-448b-bb44-6f90d0e02932\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Parsed Transcripts\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":12,\"w\":47,\"h\":42,\"i\":\"829f6b50-09c7-412e-9ffa-207b9e559068\"},\"panelIndex\":\"829f6b50-09c7-412e-9ffa-207b9e559068\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"7115f219-521f-461c-8fa6-62e4c047ae77\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"layerId\":\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\",\"layerType\":\"data\",\"title\":\"Empty Heatmap chart\",\"shape\":\"heatmap\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"maxLines\":1,\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":true,\"isXAxisTitleVisible\":true},\"valueAccessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\",\"yAccessor\":\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"xAccessor\":\"868d9ea6-3c39-4140-be03-c93645e52488\",\"palette\":{\"type\":\"palette\",\"name\":\"warm\",\"params\":{\"name\":\"warm\",\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#f7e0b8\",\"stop\":0},{\"color\":\"#f2c596\",\"stop\":20},{\"color\":\"#eca976\",\"stop\":40},{\"color\":\"#e78c5b\",\"stop\":60},{\"color\":\"#e7664c\",\"stop\":80}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"7115f219-521f-461c-8fa6-62e4c047ae77\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"2ccf1e12-d5da-4da1-93c8-73ff655d07f6\":{\"columns\":{\"6a8380bc-285b-4dac-b20d-c9694faedf89\":{\"label\":\"Spoken Words\",\"dataType\":\"number\",\"operationType\":\"sum\",\"sourceField\":\"line_word_count\",\"isBucketed\":false,\"scale\":\"ratio\",\"customLabel\":true},\"fa308c6e-590f-401b-88cd-6ec91119686e\":{\"label\":\"Character\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":250,\"orderBy\":{\"type\":\"column\",\"columnId\":\"6a8380bc-285b-4dac-b20d-c9694faedf89\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"868d9ea6-3c39-4140-be03-c93645e52488\":{\"label\":\"Episode\",\"dataType\":\"number\",\"operationType\":\"range\",\"sourceField\":\"episode_number\",\"isBucketed\":true,\"scale\":\"interval\",\"params\":{\"type\":\"histogram\",\"ranges\":[{\"from\":0,\"to\":1000,\"label\":\"\"}],\"maxBars\":100},\"customLabel\":true}},\"columnOrder\":[\"868d9ea6-3c39-4140-be03-c93645e52488\",\"fa308c6e-590f-401b-88cd-6ec91119686e\",\"6a8380bc-285b-4dac-b20d-c9694faedf89\"],\"incompleteColumns\":{}}}}}}},\"enhancements\":{},\"hidePanelTitles\":false},\"title\":\"Spoken words by character\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":54,\"w\":47,\"h\":27,\"i\":\"b9816a6c-d29b-4047-b07f-040935176f25\"},\"panelIndex\":\"b9816a6c-d29b-4047-b07f-040935176f25\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsPie\",\"type\":\"lens\",\"references\":[{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\"},{\"type\":\"index-pattern\",\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2\"},{\"type\":\"index-pattern\",\"name\":\"64253d25-2962-48be-8ac5-3f97da6874a3\",\"id\":\"the_magnus_archives_transcripts\"}],\"state\":{\"visualization\":{\"shape\":\"treemap\",\"layers\":[{\"layerId\":\"90ae15b0-2fda-46ec-a74b-5277b74626c2\",\"groups\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\"],\"metric\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\",\"numberDisplay\":\"percent\",\"categoryDisplay\":\"default\",\"legendDisplay\":\"default\",\"nestedLegend\":false,\"layerType\":\"data\"}],\"palette\":{\"type\":\"palette\",\"name\":\"default\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[{\"meta\":{\"index\":\"64253d25-2962-48be-8ac5-3f97da6874a3\",\"alias\":null,\"negate\":false,\"disabled\":false,\"type\":\"phrase\",\"key\":\"type\",\"params\":{\"query\":\"speaking\"}},\"query\":{\"match_phrase\":{\"type\":\"speaking\"}},\"$state\":{\"store\":\"appState\"}}],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"90ae15b0-2fda-46ec-a74b-5277b74626c2\":{\"columns\":{\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\":{\"label\":\"Top values of characters\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"characters\",\"isBucketed\":true,\"params\":{\"size\":50,\"orderBy\":{\"type\":\"column\",\"columnId\":\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"},\"orderDirection\":\"desc\",\"otherBucket\":true,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}}},\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\":{\"label\":\"Count of records\",\"dataType\":\"number\",\"operationType\":\"count\",\"isBucketed\":false,\"scale\":\"ratio\",\"sourceField\":\"___records___\",\"params\":{\"format\":{\"id\":\"percent\",\"params\":{\"decimals\":0}}}}},\"columnOrder\":[\"68a3d8cc-4a0c-46e7-a062-8fa794b5622a\",\"3c980f21-bcc4-4146-9b18-35cf0d8a6372\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Character appearances in all seasons\"},{\"version\":\"8.1.2\",\"type\":\"lens\",\"gridData\":{\"x\":0,\"y\":81,\"w\":47,\"h\":12,\"i\":\"acf834ce-775e-4fe1-8a0c-058496b054bf\"},\"panelIndex\":\"acf834ce-775e-4fe1-8a0c-058496b054bf\",\"embeddableConfig\":{\"attributes\":{\"title\":\"\",\"visualizationType\":\"lnsHeatmap\",\"type\":\"lens\",\"references\":[{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-current-indexpattern\",\"type\":\"index-pattern\"},{\"id\":\"the_magnus_archives_transcripts\",\"name\":\"indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"type\":\"index-pattern\"}],\"state\":{\"visualization\":{\"shape\":\"heatmap\",\"layerId\":\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\",\"layerType\":\"data\",\"legend\":{\"isVisible\":true,\"position\":\"right\",\"type\":\"heatmap_legend\"},\"gridConfig\":{\"type\":\"heatmap_grid\",\"isCellLabelVisible\":false,\"isYAxisLabelVisible\":true,\"isXAxisLabelVisible\":true,\"isYAxisTitleVisible\":false,\"isXAxisTitleVisible\":false},\"valueAccessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\",\"xAccessor\":\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"palette\":{\"name\":\"custom\",\"type\":\"palette\",\"params\":{\"steps\":5,\"name\":\"custom\",\"colorStops\":[{\"color\":\"#209280\",\"stop\":0},{\"color\":\"#54b399\",\"stop\":10},{\"color\":\"#d6bf57\",\"stop\":20},{\"color\":\"#e7664c\",\"stop\":30},{\"color\":\"#cc5642\",\"stop\":60}],\"continuity\":\"above\",\"reverse\":false,\"stops\":[{\"color\":\"#209280\",\"stop\":10},{\"color\":\"#54b399\",\"stop\":20},{\"color\":\"#d6bf57\",\"stop\":30},{\"color\":\"#e7664c\",\"stop\":60},{\"color\":\"#cc5642\",\"stop\":100}],\"rangeMin\":0,\"rangeMax\":null},\"accessor\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"}},\"query\":{\"query\":\"\",\"language\":\"kuery\"},\"filters\":[],\"datasourceStates\":{\"indexpattern\":{\"layers\":{\"e14e89f0-0a2d-4c1e-850a-f2b48021655c\":{\"columns\":{\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\":{\"label\":\"Content Warnings\",\"dataType\":\"string\",\"operationType\":\"terms\",\"scale\":\"ordinal\",\"sourceField\":\"content_warnings\",\"isBucketed\":true,\"params\":{\"size\":25,\"orderBy\":{\"type\":\"column\",\"columnId\":\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"},\"orderDirection\":\"desc\",\"otherBucket\":false,\"missingBucket\":false,\"parentFormat\":{\"id\":\"terms\"}},\"customLabel\":true},\"21c9a226-5bea-41a7-987c-70e45fb69dc8\":{\"label\":\"Unique count of content_warnings\",\"dataType\":\"number\",\"operationType\":\"unique_count\",\"scale\":\"ratio\",\"sourceField\":\"content_warnings\",\"isBucketed\":false}},\"columnOrder\":[\"89751205-27ce-4f17-bcc1-9ca76cd20cd1\",\"21c9a226-5bea-41a7-987c-70e45fb69dc8\"],\"incompleteColumns\":{}}}}}}},\"hidePanelTitles\":false,\"enhancements\":{}},\"title\":\"Top 25 Content Warnings\"}]","timeRestore":false,"title":"The Magnus Archives Dashboard","version":1},"coreMigrationVersion":"8.1.2","id":"32c54d50-be13-11ec-81b2-97a6366f6ba6","migrationVersion":{"dashboard":"8.1.0"},"references":[{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"99da6270-2caf-4343-b636-875cf81afca9:189d3670-7e30-4b2a-892e-8334795188de","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"e9bb11af-fd31-41f3-8776-962136ec98e3:1010feb4-2196-4a01-b8d1-977485aaadb5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:indexpattern-datasource-layer-9d24c917-c05b-4b46-81b3-80fecd332556","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"af3ee701-aa36-4fab-a2c6-201ebbd0ddc0:b717c122-4a56-4e4c-9e1d-c470f54a3651","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"59e9a378-8916-4b13-86de-71baeadbf947:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"59e9a378-8916-4b13-86de-71baeadbf947:indexpattern-datasource-layer-9f69b758-d8ee-46d1-a7c9-cc4ea0331ae5","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:indexpattern-datasource-layer-2ccf1e12-d5da-4da1-93c8-73ff655d07f6","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"829f6b50-09c7-412e-9ffa-207b9e559068:7115f219-521f-461c-8fa6-62e4c047ae77","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:indexpattern-datasource-layer-90ae15b0-2fda-46ec-a74b-5277b74626c2","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"b9816a6c-d29b-4047-b07f-040935176f25:64253d25-2962-48be-8ac5-3f97da6874a3","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"acf834ce-775e-4fe1-8a0c-058496b054bf:indexpattern-datasource-current-indexpattern","type":"index-pattern"},{"id":"the_magnus_archives_transcripts","name":"acf834ce-775e-4fe1-8a0c-058496b054bf:indexpattern-datasource-layer-e14e89f0-0a2d-4c1e-850a-f2b48021655c","type":"index-pattern"}],"type":"dashboard","updated_at":"2022-04-17T08:57:10.399Z","version":"WzgxMjcsOF0="}
     {"excludedObjects":[],"excludedObjectsCount":0,"exportedCount":7,"missingRefCount":0,"missingReferences":[]}
     '''
 
@@ -105,12 +115,24 @@ class MagnusEpisode(object):
         represent a transcript
     """
 
+    # first and last episode number of every season
+    seasons = {
+        1: (1, 40),
+        2: (41, 80),
+        3: (81, 120),
+        4: (121, 160),
+        5: (161, 200),
+    }
+
     def __init__(self, doc: str):
 
         # placeholder values to fill in during parsing
         self.content_warnings = list()
         self.lines = list()
         self.filename = os.path.basename(doc)
+        self.has_theme_intro = False
+        self.episode_characters = list()
+        self.character_transitions = dict()
 
         self.paragraphs_to_ignore_in_transcripts = [
             None,
@@ -148,16 +170,9 @@ class MagnusEpisode(object):
 
         n = int(self.episode_number)
 
-        if n < 41:
-            return 1
-        if n < 81:
-            return 2
-        if n < 121:
-            return 3
-        if n < 161:
-            return 4
-        if n < 201:
-            return 5
+        for season, (first, last) in self.seasons.items():
+            if n <= last:
+                return season
 
         raise ValueError(f'Unable to get season from episode number {self.episode_number}')
 
@@ -421,6 +436,7 @@ class MagnusEpisode(object):
                     logging.debug(f'theme intro paragraph')
                     is_content_warning = False
                     is_episode_transcript = True
+                    self.has_theme_intro = True
                     continue
 
                 # and after the outro music we aren't inside the content anymore
@@ -518,6 +534,34 @@ class MagnusEpisode(object):
                     ))
                     last_line_was = 'speaking'
 
+        # with all lines in place we can figure out who is talking to whom
+        self._build_character_graph()
+
+    def _build_character_graph(self):
+        """
+        build the character graph of the episode.
+        all characters with speaking or acting lines appear together in the episode,
+        and every change of the speaking characters between two consecutive spoken lines is a turn from
+        the previous to the next characters
+
+        :return:
+        """
+
+        self.episode_characters = sorted(set(c for l in self.lines for c in l.characters or list()))
+        self.character_transitions = dict()
+
+        previous_characters = None
+        for line in self.lines:
+            if line.type != 'speaking' or not line.characters:
+                continue
+
+            if previous_characters and previous_characters != line.characters:
+                for source in previous_characters:
+                    for target in line.characters:
+                        if source != target:
+                            self.character_transitions[(source, target)] = self.character_transitions.get((source, target), 0) + 1
+
+            previous_characters = line.characters
 
     def get_transcript_lines_for_index(self):
         """
@@ -542,4 +586,29 @@ class MagnusEpisode(object):
                 document=l
             ))
 
-        return lines_for_index
\ No newline at end of file
+        return lines_for_index
+
+    def get_parse_summary(self):
+        """
+        return a summary of the parsed transcript, used to validate the parser results
+        :return: dictionary with the episode information and line statistics
+        """
+
+        types = dict()
+        characters = dict()
+        for line in self.lines:
+            types[line.type] = types.get(line.type, 0) + 1
+            for c in line.characters or list():
+                characters[c] = characters.get(c, 0) + 1
+
+        return dict(
+            episode_number=int(self.episode_number),
+            episode_title=self.episode_title,
+            season=self.season,
+            lines=len(self.lines),
+            types=types,
+            characters=characters,
+            content_warnings=len(self.content_warnings),
+            has_theme_intro=self.has_theme_intro,
+            is_legacy_transcript=self._is_legacy_transcript(self.episode_title),
+        )
@@ -0,0 +1,123 @@
+import copy
+import importlib
+
+
+class ShowPlugin(object):
+    """
+        a show which can be parsed and indexed.
+        the module containing the episode parser and the index definition is only imported on first use
+    """
+
+    def __init__(self, name: str, module: str, episode_class: str, index_class: str, number_of_shards: int=None, routing_field: str=None, episode_field: str='episode_number'):
+        """
+
+        :param name: short name of the show, used on the command line
+        :param module: python module containing the episode parser and the index definition
+        :param episode_class: name of the episode parser class, initialized with the path to the transcript
+        :param index_class: name of the index definition class (index name, settings, mappings and kibana dashboard)
+        :param number_of_shards: optional number of shards for the show index, overrides the index definition
+        :param routing_field: optional document field used to route the documents to the shards
+        :param episode_field: document field (and episode attribute) identifying the episode
+        """
+
+        self.name = name
+        self.module = module
+        self.episode_class = episode_class
+        self.index_class = index_class
+        self.number_of_shards = number_of_shards
+        self.routing_field = routing_field
+        self.episode_field = episode_field
+
+    def _get_attribute(self, attribute: str):
+        """
+        import the show module and return the given attribute
+        :param attribute: name of the attribute
+        :return:
+        """
+
+        return getattr(importlib.import_module(self.module), attribute)
+
+    @property
+    def episode(self):
+        """
+        the episode parser class
+        :return:
+        """
+
+        return self._get_attribute(self.episode_class)
+
+    @property
+    def index(self):
+        """
+        the index definition class
+        :return:
+        """
+
+        return self._get_attribute(self.index_class)
+
+    def get_index_settings(self):
+        """
+        return the index settings for the show with the shard count applied
+        :return: index settings
+        """
+
+        settings = copy.deepcopy(self.index.index_settings)
+        if self.number_of_shards:
+            settings['index']['number_of_shards'] = self.number_of_shards
+
+        return settings
+
+    def parse(self, path: str):
+        """
+        parse the given transcript
+        :param path: path to the transcript
+        :return: episode
+        """
+
+        return self.episode(doc=path)
+
+
+# all shows known to the importer
+shows = dict()
+
+
+def register_show(show: ShowPlugin):
+    """
+    add the given show to the registry
+    :param show:
+    :return:
+    """
+
+    shows[show.name] = show
+
+
+def get_show(name: str):
+    """
+    return the show with the given name
+    :param name:
+    :return: show plugin
+    """
+
+    if name not in shows:
+        raise ValueError(f'Unknown show {name}, known shows are {", ".join(get_show_names())}')
+
+    return shows[name]
+
+
+def get_show_names():
+    """
+    return the names of all registered shows
+    :return: list of names
+    """
+
+    return sorted(shows.keys())
+
+
+register_show(ShowPlugin(
+    name='magnus',
+    module='transcript.magnusarchives',
+    episode_class='MagnusEpisode',
+    index_class='MagnusTranscriptIndex',
+    number_of_shards=1,
+    routing_field='episode_number',
+))
@@ -0,0 +1,283 @@
+import array
+import json
+import logging
+import mmap
+import struct
+import threading
+
+import numpy as np
+
+from .enrichment import enrich_documents
+
+
+class CorpusStore(object):
+    """
+        read only access to a corpus store file. the file is memory mapped,
+        the columns are numpy arrays on top of the mapping and are only read from disk when accessed
+    """
+
+    magic = b'TMACORP1'
+
+    # the line types are stored as one byte codes
+    line_types = ['sfx', 'acting', 'speaking']
+
+    def __init__(self, path: str):
+        """
+        :param path: path to the corpus store file
+        """
+
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mmap[:len(self.magic)] != self.magic:
+            raise ValueError(f'{path} is not a corpus store file')
+
+        header_length, = struct.unpack_from('<Q', self.mmap, len(self.magic))
+        header = json.loads(self.mmap[len(self.magic) + 8:len(self.magic) + 8 + header_length].decode())
+
+        self.columns = dict()
+        for name, column in header['columns'].items():
+            self.columns[name] = np.frombuffer(self.mmap, dtype=column['dtype'], count=column['length'], offset=column['offset'])
+
+    def __len__(self):
+        return len(self.columns['line_position'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        release the column arrays and close the memory mapping.
+        the mapping can't be closed while views of the columns are still in use (e.g. slices kept by the caller
+        or frames of a traceback), it is then left to the garbage collector. copy slices to keep them after closing
+
+        :return:
+        """
+
+        self.columns = dict()
+        try:
+            self.mmap.close()
+        except BufferError:
+            logging.debug(f'Column views of corpus store {self.path} are still in use, the mapping is released once they are gone')
+        self.file.close()
+
+    def get_string(self, string_id: int):
+        """
+        return the string with the given id from the string table
+        :param string_id:
+        :return:
+        """
+
+        offsets = self.columns['string_offsets']
+
+        return self.columns['string_blob'][offsets[string_id]:offsets[string_id + 1]].tobytes().decode()
+
+    def _get_strings(self, column: str, offsets: str, row: int):
+        """
+        return the strings of a list column
+        :param column: name of the column containing the string ids
+        :param offsets: name of the column containing the offsets per row
+        :param row:
+        :return: list of strings
+        """
+
+        start, end = self.columns[offsets][row], self.columns[offsets][row + 1]
+
+        return [self.get_string(i) for i in self.columns[column][start:end]]
+
+    def get_line(self, row: int):
+        """
+        return the transcript line with the given row number
+        :param row:
+        :return: dictionary with the line fields
+        """
+
+        offsets = self.columns['text_offsets']
+        characters = self._get_strings('line_characters', 'line_character_offsets', row)
+
+        return dict(
+            position=int(self.columns['line_position'][row]),
+            line=self.columns['text_blob'][offsets[row]:offsets[row + 1]].tobytes().decode(),
+            type=self.line_types[self.columns['line_type'][row]],
+            characters=characters if characters else None,
+        )
+
+    def get_episode(self, episode: int):
+        """
+        return the episode information for the given episode row
+        :param episode:
+        :return: dictionary with the episode fields
+        """
+
+        return dict(
+            show=self.get_string(self.columns['episode_show'][episode]),
+            season=int(self.columns['episode_season'][episode]),
+            episode_number=self.get_string(self.columns['episode_label'][episode]),
+            episode_title=self.get_string(self.columns['episode_title'][episode]),
+            filename=self.get_string(self.columns['episode_filename'][episode]),
+            content_warnings=self._get_strings('episode_warnings', 'episode_warning_offsets', episode),
+        )
+
+    def iter_documents(self):
+        """
+        iterate over all transcript lines in the same format as the episode parsers return them for the index,
+        including the line statistics added while importing
+        :return: generator of dictionaries with the keys show, document_id and document
+        """
+
+        episode = None
+        episode_row = -1
+        for row in range(len(self)):
+            if self.columns['line_episode'][row] != episode_row:
+                episode_row = self.columns['line_episode'][row]
+                episode = self.get_episode(episode_row)
+
+            document = self.get_line(row)
+            document.update({k: v for k, v in episode.items() if k != 'show'})
+
+            yield enrich_documents([dict(
+                show=episode['show'],
+                document_id=f'{episode["episode_number"]}-{document["position"]}',
+                document=document
+            )])[0]
+
+
+class CorpusStoreWriter(object):
+    """
+        collect the parsed episodes and write them as corpus store file
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: the corpus store is written to this path
+        """
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.strings = dict()
+
+        self.columns = dict(
+            episode_show=array.array('I'),
+            episode_season=array.array('B'),
+            episode_number=array.array('h'),
+            episode_label=array.array('I'),
+            episode_title=array.array('I'),
+            episode_filename=array.array('I'),
+            episode_warning_offsets=array.array('I', [0]),
+            episode_warnings=array.array('I'),
+            line_episode=array.array('I'),
+            line_season=array.array('B'),
+            line_episode_number=array.array('h'),
+            line_position=array.array('i'),
+            line_type=array.array('B'),
+            line_character_offsets=array.array('I', [0]),
+            line_characters=array.array('I'),
+            text_offsets=array.array('Q', [0]),
+        )
+        self.text = bytearray()
+
+    def _get_string_id(self, value: str):
+        """
+        return the id of the given string in the string table, new strings are added
+        :param value:
+        :return: string id
+        """
+
+        if value not in self.strings:
+            self.strings[value] = len(self.strings)
+
+        return self.strings[value]
+
+    def add_episode(self, show, episode):
+        """
+        add all transcript lines of the given episode
+        :param show: the show the episode belongs to
+        :param episode:
+        :return:
+        """
+
+        with self.lock:
+            c = self.columns
+            episode_row = len(c['episode_show'])
+
+            c['episode_show'].append(self._get_string_id(show.name))
+            c['episode_season'].append(episode.season)
+            c['episode_number'].append(int(episode.episode_number))
+            c['episode_label'].append(self._get_string_id(episode.episode_number))
+            c['episode_title'].append(self._get_string_id(episode.episode_title))
+            c['episode_filename'].append(self._get_string_id(episode.filename))
+            c['episode_warnings'].extend(self._get_string_id(w) for w in episode.content_warnings)
+            c['episode_warning_offsets'].append(len(c['episode_warnings']))
+
+            for line in episode.lines:
+                c['line_episode'].append(episode_row)
+                c['line_season'].append(episode.season)
+                c['line_episode_number'].append(int(episode.episode_number))
+                c['line_position'].append(line.position)
+                c['line_type'].append(CorpusStore.line_types.index(line.type))
+                c['line_characters'].extend(self._get_string_id(a) for a in line.characters or list())
+                c['line_character_offsets'].append(len(c['line_characters']))
+
+                self.text.extend(line.line.encode())
+                c['text_offsets'].append(len(self.text))
+
+    def write(self):
+        """
+        write the collected episodes to the configured path
+        :return:
+        """
+
+        with self.lock:
+            string_blob = bytearray()
+            string_offsets = array.array('Q', [0])
+            for s in self.strings:
+                string_blob.extend(s.encode())
+                string_offsets.append(len(string_blob))
+
+            columns = dict(
+                string_offsets=np.frombuffer(string_offsets, dtype=np.uint64),
+                string_blob=np.frombuffer(bytes(string_blob), dtype=np.uint8),
+                text_blob=np.frombuffer(bytes(self.text), dtype=np.uint8),
+            )
+            for name, values in self.columns.items():
+                columns[name] = np.frombuffer(values, dtype=values.typecode)
+
+            # the header contains the position of every column, the columns are aligned to 8 bytes
+            # so the reader can map them without copying
+            header = dict(columns=dict())
+            header_length = 4096
+            while True:
+                offset = self._align(len(CorpusStore.magic) + 8 + header_length)
+                for name, values in columns.items():
+                    header['columns'][name] = dict(offset=offset, dtype=values.dtype.str, length=len(values))
+                    offset = self._align(offset + values.nbytes)
+
+                encoded_header = json.dumps(header).encode()
+                if len(encoded_header) <= header_length:
+                    break
+                header_length *= 2
+
+            with open(self.path, 'wb') as f:
+                f.write(CorpusStore.magic)
+                f.write(struct.pack('<Q', header_length))
+                f.write(encoded_header.ljust(header_length))
+
+                for name, values in columns.items():
+                    f.seek(header['columns'][name]['offset'])
+                    f.write(values.tobytes())
+
+                # empty columns at the end still need to be inside the file
+                f.truncate(offset)
+
+    def _align(self, offset: int):
+        """
+        return the next offset aligned to 8 bytes
+        :param offset:
+        :return:
+        """
+
+        return (offset + 7) // 8 * 8
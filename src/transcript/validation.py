@@ -0,0 +1,149 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from .registry import get_show
+
+
+def get_parse_summary_for_file(show_name: str, path: str):
+    """
+    parse the given file and return the parse summary of the episode.
+    runs in a worker process, so only the show name is passed and errors are returned instead of raised
+
+    :param show_name: name of the show the file belongs to
+    :param path: path to the transcript
+    :return: dictionary with the file, the show and the parse summary or the parse error
+    """
+
+    # the workers don't need the log output of the parser
+    logging.getLogger().setLevel(logging.WARNING)
+
+    try:
+        summary = get_show(show_name).parse(path).get_parse_summary()
+    except BaseException as e:
+        return dict(file=path, show=show_name, error=str(e))
+
+    return dict(file=path, show=show_name, **summary)
+
+
+def get_parse_summaries(files: list, concurrency: int=None):
+    """
+    parse all given files in parallel
+    :param files: list of (show, path) tuples
+    :param concurrency: number of worker processes, defaults to the number of cpus
+    :return: list of parse summaries
+    """
+
+    with ProcessPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(get_parse_summary_for_file, show.name, path) for show, path in files]
+
+        return [f.result() for f in futures]
+
+
+def get_episode_anomalies(summary: dict, actor_episodes: dict, sfx_ratio: float, min_actor_episodes: int):
+    """
+    return the anomalies of a single parsed episode
+    :param summary: parse summary of the episode
+    :param actor_episodes: number of episodes per actor over the whole corpus, None if the corpus is too small
+    :param sfx_ratio: maximum ratio of sfx lines
+    :param min_actor_episodes: actors appearing in less episodes are reported as unknown
+    :return: list of anomalies
+    """
+
+    if 'error' in summary:
+        return [dict(type='parse_error', message=summary['error'])]
+
+    anomalies = list()
+
+    if summary['lines'] == 0:
+        anomalies.append(dict(type='zero_lines'))
+    elif summary['types'].get('sfx', 0) / summary['lines'] > sfx_ratio:
+        anomalies.append(dict(type='high_sfx_ratio', ratio=round(summary['types'].get('sfx', 0) / summary['lines'], 3)))
+
+    unknown_actors = sorted(a for a in summary['characters'] if actor_episodes is not None and actor_episodes.get(a, 0) < min_actor_episodes)
+    if unknown_actors:
+        anomalies.append(dict(type='unknown_actors', actors=unknown_actors))
+
+    # the legacy transcripts don't contain content warnings nor an intro
+    if not summary['is_legacy_transcript']:
+        if summary['content_warnings'] == 0:
+            anomalies.append(dict(type='missing_content_warnings'))
+        if not summary['has_theme_intro']:
+            anomalies.append(dict(type='missing_theme_intro'))
+
+    return anomalies
+
+
+def get_episode_gaps(summaries: list, seasons: dict):
+    """
+    return the episode numbers missing in the seasons which are part of the corpus
+    :param summaries: parse summaries of a single show
+    :param seasons: first and last episode number per season
+    :return: dictionary with the season as key and the list of missing or duplicated episode numbers as value
+    """
+
+    episode_numbers = [s['episode_number'] for s in summaries if 'error' not in s]
+
+    gaps = dict()
+    for season, (first, last) in seasons.items():
+        found = [n for n in episode_numbers if first <= n <= last]
+        if not found:
+            continue
+
+        missing = sorted(set(range(first, last + 1)) - set(found))
+        duplicated = sorted(set(n for n in found if found.count(n) > 1))
+        if missing or duplicated:
+            gaps[season] = dict(missing=missing, duplicated=duplicated)
+
+    return gaps
+
+
+def get_validation_report(files: list, concurrency: int=None, sfx_ratio: float=0.5, min_actor_episodes: int=2):
+    """
+    parse all given files in parallel and return a report with the anomalies per episode
+    and the gaps in the episode numbers per show
+
+    :param files: list of (show, path) tuples
+    :param concurrency: number of worker processes, defaults to the number of cpus
+    :param sfx_ratio: maximum ratio of sfx lines per episode
+    :param min_actor_episodes: actors appearing in less episodes of a show are reported as unknown
+    :return: validation report
+    """
+
+    summaries = get_parse_summaries(files=files, concurrency=concurrency)
+    shows = {show.name: show for show, path in files}
+
+    report = dict(shows=dict())
+    for name, show in shows.items():
+        show_summaries = [s for s in summaries if s['show'] == name]
+
+        # count in how many episodes every actor appears
+        actor_episodes = dict()
+        for s in show_summaries:
+            for a in s.get('characters', dict()):
+                actor_episodes[a] = actor_episodes.get(a, 0) + 1
+        # with less episodes than required every actor would be unknown
+        if len(show_summaries) < min_actor_episodes:
+            actor_episodes = None
+
+        episodes = list()
+        for s in sorted(show_summaries, key=lambda s: (s.get('episode_number', -1), s['file'])):
+            episodes.append(dict(
+                file=s['file'],
+                episode_number=s.get('episode_number'),
+                episode_title=s.get('episode_title'),
+                lines=s.get('lines', 0),
+                anomalies=get_episode_anomalies(s, actor_episodes=actor_episodes, sfx_ratio=sfx_ratio, min_actor_episodes=min_actor_episodes),
+            ))
+
+        report['shows'][name] = dict(
+            files=len(show_summaries),
+            lines=sum(e['lines'] for e in episodes),
+            episodes_with_anomalies=len([e for e in episodes if e['anomalies']]),
+            gaps=get_episode_gaps(show_summaries, seasons=getattr(show.episode, 'seasons', dict())),
+            episodes=episodes,
+        )
+
+    report['files'] = len(summaries)
+    report['episodes_with_anomalies'] = sum(s['episodes_with_anomalies'] for s in report['shows'].values())
+
+    return report
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import click
+import json
+import sys
+import logging
+
+from transcript import get_show, get_show_names, get_files_to_parse_per_show, get_validation_report
+
+@click.command()
+@click.argument(
+    'path',
+    nargs=-1
+)
+@click.option(
+    '--loglevel',
+    required=False,
+    envvar='LOGLEVEL',
+    type=click.Choice(['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG']),
+    default="WARNING",
+    help="The loglevel for the script execution",
+    show_default=True
+)
+@click.option(
+    '--show',
+    'show_names',
+    required=True,
+    envvar='SHOW',
+    multiple=True,
+    default=['magnus'],
+    type=click.Choice(get_show_names()),
+    help='Transcripts are parsed for which show? Can be given multiple times, paths are then prefixed with the show (magnus=/transcripts/magnus)',
+    show_default=True
+)
+@click.option(
+    '--concurrency',
+    required=False,
+    envvar='CONCURRENCY',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of documents parsed in parallel, defaults to the number of cpus',
+    show_default=True
+)
+@click.option(
+    '--sfx-ratio',
+    required=False,
+    envvar='SFX_RATIO',
+    type=click.FloatRange(min=0, max=1),
+    default=0.5,
+    help='Report episodes with a higher ratio of sfx lines',
+    show_default=True
+)
+@click.option(
+    '--min-actor-episodes',
+    required=False,
+    envvar='MIN_ACTOR_EPISODES',
+    type=click.IntRange(min=1),
+    default=2,
+    help='Report actors appearing in less episodes as unknown',
+    show_default=True
+)
+@click.option(
+    '--output',
+    required=False,
+    envvar='OUTPUT',
+    type=click.File('w'),
+    default='-',
+    help='Write the json report to the given file',
+    show_default=True
+)
+@click.option(
+    '--fail-on-anomalies',
+    required=False,
+    is_flag=True,
+    default=False,
+    help='Exit with status 2 if any anomalies are found',
+    show_default=True
+)
+def run(path, loglevel, show_names, concurrency, sfx_ratio, min_actor_episodes, output, fail_on_anomalies):
+    """
+    parse all transcripts in parallel and report parsing anomalies per episode as json
+
+    :return:
+    """
+
+    logging.basicConfig(level=loglevel)
+
+    shows = [get_show(name) for name in show_names]
+    files_to_parse = get_files_to_parse_per_show(paths=path, shows=shows)
+
+    report = get_validation_report(
+        files=files_to_parse,
+        concurrency=concurrency,
+        sfx_ratio=sfx_ratio,
+        min_actor_episodes=min_actor_episodes
+    )
+
+    json.dump(report, output, indent=2)
+    output.write('\n')
+
+    logging.info(f'Validated {report["files"]} files, {report["episodes_with_anomalies"]} episodes with anomalies')
+
+    if fail_on_anomalies and report['episodes_with_anomalies']:
+        sys.exit(2)
+
+if __name__ == '__main__':
+    try:
+        run()
+    except Exception as e:
+        logging.error(e)
+        sys.exit(1)
@@ -0,0 +1,49 @@
+from es import BulkBatchController
+
+
+def test_initial_batch_limited_to_max_bytes():
+    controller = BulkBatchController(max_bytes=100000)
+
+    assert controller.batch_bytes == 100000
+    assert controller.get_batch([100] * 20000, 0) == 1000
+
+
+def test_batch_never_exceeds_max_bytes():
+    for max_bytes, size in [(100000, 60000), (1024, 1000), (5000, 333)]:
+        controller = BulkBatchController(max_bytes=max_bytes)
+        sizes = [size] * 100
+
+        start = 0
+        while start < len(sizes):
+            end = controller.get_batch(sizes, start)
+            assert end > start
+            assert sum(sizes[start:end]) <= max_bytes
+            start = end
+
+
+def test_single_oversized_document():
+    controller = BulkBatchController(max_bytes=1000)
+
+    assert controller.get_batch([5000, 10], 0) == 1
+
+
+def test_shrinking_stays_below_max_bytes():
+    controller = BulkBatchController(max_bytes=2048)
+
+    controller.record(latency=5.0)
+    assert controller.batch_bytes <= 2048
+
+    controller.record(latency=0.1, timed_out=True)
+    assert controller.batch_bytes <= 2048
+    assert controller.get_state()['timeouts'] == 1
+
+
+def test_growth_and_shrink():
+    controller = BulkBatchController(initial_bytes=1000, min_bytes=500, max_bytes=1200)
+
+    controller.record(latency=0.1)
+    assert controller.batch_bytes == 1200
+
+    for _ in range(5):
+        controller.record(latency=0.1, rejected=True)
+    assert controller.batch_bytes == 500
@@ -0,0 +1,87 @@
+import pytest
+from docx import Document
+
+from transcript import CorpusStore, CorpusStoreWriter, enrich_documents, get_show
+
+
+def write_transcript(path, episode_number: int, title: str):
+    """
+    write a minimal magnus archives transcript
+    :param path:
+    :param episode_number:
+    :param title:
+    :return:
+    """
+
+    document = Document()
+    for paragraph in [
+        f'MAG {episode_number:03d} – {title}',
+        'Content Warnings',
+        '- Spiders',
+        '- Blood',
+        '[The Magnus Archives Theme – Intro]',
+        '[CLICK]',
+        'ARCHIVIST',
+        'Statement of someone, regarding things.',
+        '(sighs)',
+        'MARTIN',
+        'Tea, Jon? Or coffee…',
+        'ARCHIVIST',
+        'No thank you Martin.',
+        '[CLICK]',
+        '[The Magnus Archives Theme – Outro]',
+    ]:
+        document.add_paragraph(paragraph)
+    document.save(str(path))
+
+
+@pytest.fixture
+def episodes(tmp_path):
+    show = get_show('magnus')
+    episodes = list()
+    for episode_number, title in [(1, 'Anglerfish'), (2, 'Do Not Open'), (41, 'Binary')]:
+        path = tmp_path / f'mag-{episode_number}.docx'
+        write_transcript(path, episode_number, title)
+        episodes.append(show.parse(str(path)))
+
+    return show, episodes
+
+
+@pytest.fixture
+def store_path(tmp_path, episodes):
+    show, parsed = episodes
+    path = tmp_path / 'corpus.tmac'
+
+    writer = CorpusStoreWriter(str(path))
+    for episode in parsed:
+        writer.add_episode(show, episode)
+    writer.write()
+
+    return str(path)
+
+
+def test_round_trip(episodes, store_path):
+    show, parsed = episodes
+    expected = [dict(show=show.name, **d) for episode in parsed for d in enrich_documents(episode.get_transcript_lines_for_index())]
+
+    with CorpusStore(store_path) as store:
+        assert len(store) == len(expected)
+        assert list(store.iter_documents()) == expected
+
+
+def test_close_with_column_views(store_path):
+    store = CorpusStore(store_path)
+    line_types = store.columns['line_type'][:5]
+
+    store.close()
+
+    assert store.columns == dict()
+    assert len(line_types) == 5
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / 'invalid.tmac'
+    path.write_bytes(b'NOTACORPUS' + bytes(32))
+
+    with pytest.raises(ValueError):
+        CorpusStore(str(path))